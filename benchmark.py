@@ -0,0 +1,304 @@
+"""Benchmarks of the file-driven solvers of pydefis.py on synthetic inputs.
+
+For each solver, a deterministic generator writes an input file of the same
+format as the real one, with the requested number of records, in a temporary
+folder. The solver runs from that folder in its own process (see lot.py),
+its caches being written there too, and its wall time, throughput and peak
+memory are measured for each size, on a second run so that the caches are
+already built. The scaling exponent is the slope of log(time) against
+log(size).
+
+Measures can be saved as a reference and later runs are compared to it,
+so that regressions show up when an implementation changes.
+
+Usage:
+    python benchmark.py
+    python benchmark.py surveillance --tailles 1000 10000 100000 --delai 60
+    python benchmark.py --enregistrer
+    python benchmark.py thor_le_narcissique --froid
+"""
+import argparse
+import json
+import math
+import os.path
+import random
+import shutil
+import string
+import tempfile
+from typing import Any, Callable
+
+from lot import OK, executer_lot
+from registre import DOSSIER
+
+REFERENCE = os.path.join(DOSSIER, "benchmark_reference.json")
+GRAINE = 42
+BLOC = 10_000
+
+
+def _ecrire(fichier: str, lignes: Callable[[int], str], n: int) -> None:
+    """Write n generated lines to fichier, by blocks.
+
+    :param fichier (str): path of the file to write
+    :param lignes (Callable[[int], str]): builds the line of given index,
+        newline excluded
+    :param n (int): number of lines
+    """
+    os.makedirs(os.path.dirname(fichier), exist_ok=True)
+    with open(fichier, mode="w", encoding="utf-8") as f:
+        for debut in range(0, n, BLOC):
+            f.write("".join(f"{lignes(i)}\n" for i in range(debut, min(n, debut + BLOC))))
+
+
+def generer_surveillance(dossier: str, n: int, alea: random.Random) -> None:
+    """Agents coordinates, "x, y" per line.
+
+    :param dossier (str): folder where to write the data folder
+    :param n (int): number of agents
+    :param alea (random.Random): random generator
+    """
+    # keep the density of the real file, about 1 agent per 625 square units
+    borne = max(200, int(12.5 * math.sqrt(n)))
+    _ecrire(os.path.join(dossier, "surveillance", "entree.txt"),
+            lambda _: f"{alea.randint(-borne, borne)}, {alea.randint(-borne, borne)}", n)
+
+
+def generer_les_victimes_de_tooms_1(dossier: str, n: int, alea: random.Random) -> None:
+    """Toothprints, "NNN - d1, ..., d10" per line, one in ten being a Tooms' one.
+
+    :param dossier (str): folder where to write the data folder
+    :param n (int): number of toothprints
+    :param alea (random.Random): random generator
+    """
+    tooms = [10, 12, 6, 9, 18.5, 22, 7, 4, 9, 10]
+
+    def ligne(i: int) -> str:
+        """Build a toothprint.
+
+        :param i (int): index of the toothprint
+        :return (str): the line
+        """
+        decalage = alea.randint(-12, 12) / 4
+        if alea.random() < 0.1:
+            empreinte = [dent + decalage for dent in tooms]
+        else:
+            empreinte = [dent + decalage + alea.randint(-8, 8) / 4 for dent in tooms]
+        return f"{i + 1:03d} - {', '.join(str(dent) for dent in empreinte)}"
+
+    _ecrire(os.path.join(dossier, "les_victimes_de_tooms_1", "empreintes.txt"), ligne, n)
+
+
+def generer_analyse_de_sequences_2_2(dossier: str, n: int, alea: random.Random) -> None:
+    """Motif on the first line, an empty line, then one sequence per line.
+
+    :param dossier (str): folder where to write the data folder
+    :param n (int): number of sequences
+    :param alea (random.Random): random generator
+    """
+    destination = os.path.join(dossier, "analyse_de_sequences_2_2")
+    os.makedirs(destination, exist_ok=True)
+    shutil.copy(os.path.join(DOSSIER, "analyse_de_sequences_2_2", "symboles.json"), destination)
+
+    motif = "MNGHNNNNNKRRBNN"
+    with open(os.path.join(destination, "entree.txt"), mode="w", encoding="utf-8") as f:
+        f.write(f"{motif}\n\n")
+        for debut in range(0, n, BLOC):
+            bloc = ("".join(alea.choices("ACGU", k=len(motif)))
+                    for _ in range(debut, min(n, debut + BLOC)))
+            f.write("\n".join(bloc))
+            if debut + BLOC < n:
+                f.write("\n")
+
+
+def generer_thor_le_narcissique(dossier: str, n: int, alea: random.Random) -> None:
+    """One lowercase word per line.
+
+    :param dossier (str): folder where to write the data folder
+    :param n (int): number of words
+    :param alea (random.Random): random generator
+    """
+    _ecrire(os.path.join(dossier, "thor_le_narcissique", "liste_mots.txt"),
+            lambda _: "".join(alea.choices(string.ascii_lowercase, k=alea.randint(1, 15))), n)
+
+
+def generer_meli_melo_d_adresses(dossier: str, n: int, alea: random.Random) -> None:
+    """One address per line, the searched one being the last one.
+
+    :param dossier (str): folder where to write the data folder
+    :param n (int): number of addresses
+    :param alea (random.Random): random generator
+    """
+    voies = ["rue", "avenue", "boulevard", "impasse", "place", "chemin"]
+
+    def ligne(i: int) -> str:
+        """Build an address.
+
+        :param i (int): index of the address
+        :return (str): the line
+        """
+        if i == n - 1:
+            return "rue goya le mee-sur-seine"
+        mots = ("".join(alea.choices(string.ascii_lowercase, k=alea.randint(3, 10)))
+                for _ in range(alea.randint(2, 4)))
+        return f"{alea.choice(voies)} {' '.join(mots)}"
+
+    _ecrire(os.path.join(dossier, "meli_melo_d_adresses", "adresses.txt"), ligne, n)
+
+
+GENERATEURS = {
+    "surveillance": generer_surveillance,
+    "les_victimes_de_tooms_1": generer_les_victimes_de_tooms_1,
+    "analyse_de_sequences_2_2": generer_analyse_de_sequences_2_2,
+    "thor_le_narcissique": generer_thor_le_narcissique,
+    "meli_melo_d_adresses": generer_meli_melo_d_adresses,
+}
+
+
+def exposant(mesures: list[dict[str, Any]]) -> float | None:
+    """Scaling exponent: least squares slope of log(time) against log(size).
+
+    :param mesures (list[dict[str, Any]]): measures of a solver
+    :return (float | None): the exponent, None with less than two measures
+    """
+    points = [(math.log(m["taille"]), math.log(m["duree"]))
+              for m in mesures if m["statut"] == OK and m["duree"] > 0]
+    if len(points) < 2:
+        return None
+
+    moyenne_x = sum(x for x, _ in points) / len(points)
+    moyenne_y = sum(y for _, y in points) / len(points)
+    covariance = sum((x - moyenne_x) * (y - moyenne_y) for x, y in points)
+    variance = sum((x - moyenne_x) ** 2 for x, _ in points)
+    return covariance / variance
+
+
+def mesurer(nom: str, tailles: list[int], delai: float, froid: bool = False) -> dict[str, Any]:
+    """Benchmark a solver on inputs of growing sizes.
+
+    The caches built from the input (compiled word lists) are written in the
+    temporary folder. Unless froid is True, a first run fills them and the
+    second one is measured. Once the solver exceeds delai, larger sizes are
+    not tried.
+
+    :param nom (str): name of the solver
+    :param tailles (list[int]): numbers of records
+    :param delai (float): time in seconds after which a run is stopped
+    :param froid (bool): measure the first run, caches included
+    :return (dict[str, Any]): measures for each size and scaling exponent
+    """
+    mesures = []
+    for taille in sorted(tailles):
+        with tempfile.TemporaryDirectory(prefix="pydefis_") as dossier:
+            GENERATEURS[nom](dossier, taille, random.Random(GRAINE))
+            ancien_cache = os.environ.get("PYDEFIS_CACHE")
+            os.environ["PYDEFIS_CACHE"] = os.path.join(dossier, ".cache")
+            try:
+                rapport = executer_lot([(nom, [])], processus=1, delai=delai, dossier=dossier)[0]
+                if not froid and rapport["statut"] == OK:
+                    rapport = executer_lot([(nom, [])], processus=1, delai=delai,
+                                           dossier=dossier)[0]
+            finally:
+                if ancien_cache is None:
+                    del os.environ["PYDEFIS_CACHE"]
+                else:
+                    os.environ["PYDEFIS_CACHE"] = ancien_cache
+
+        mesure = {
+            "taille": taille,
+            "statut": rapport["statut"],
+            "duree": rapport.get("duree"),
+            "memoire_max": rapport.get("memoire_max"),
+            "debit": None,
+        }
+        if rapport["statut"] == OK and rapport["duree"]:
+            mesure["debit"] = taille / rapport["duree"]
+        mesures.append(mesure)
+        if rapport["statut"] != OK:
+            break
+
+    return {"mesures": mesures, "exposant": exposant(mesures)}
+
+
+def comparer(resultats: dict[str, Any], reference: dict[str, Any],
+             tolerance: float) -> list[str]:
+    """Compare measures to the reference ones.
+
+    :param resultats (dict[str, Any]): measures returned by mesurer, by solver
+    :param reference (dict[str, Any]): reference measures, by solver
+    :param tolerance (float): relative slowdown accepted, 0.25 for 25 %
+    :return (list[str]): description of each regression
+    """
+    regressions = []
+    for nom, resultat in resultats.items():
+        anciennes = {m["taille"]: m for m in reference.get(nom, {}).get("mesures", [])}
+        for mesure in resultat["mesures"]:
+            ancienne = anciennes.get(mesure["taille"])
+            if ancienne is None or ancienne["statut"] != OK:
+                continue
+            if mesure["statut"] != OK:
+                regressions.append(f"{nom} n={mesure['taille']} : {mesure['statut']}")
+            elif mesure["duree"] > ancienne["duree"] * (1 + tolerance):
+                regressions.append(
+                    f"{nom} n={mesure['taille']} : {mesure['duree']:.3f} s "
+                    f"au lieu de {ancienne['duree']:.3f} s")
+
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command line entry point.
+
+    :param argv (list[str] | None): command line arguments, sys.argv[1:] if None
+    :return (int): exit status, the number of regressions
+    """
+    parser = argparse.ArgumentParser(description="Benchmarks des défis sur données synthétiques")
+    parser.add_argument("noms", nargs="*",
+                        help=f"défis à mesurer parmi {', '.join(GENERATEURS)} (défaut : tous)")
+    parser.add_argument("--tailles", nargs="+", type=int,
+                        default=[10**3, 10**4, 10**5, 10**6, 10**7],
+                        help="nombres d'enregistrements (défaut : 10^3 à 10^7)")
+    parser.add_argument("--delai", type=float, default=120.0,
+                        help="durée maximale d'une mesure, en secondes (défaut : 120)")
+    parser.add_argument("--reference", default=REFERENCE,
+                        help="fichier des mesures de référence")
+    parser.add_argument("--enregistrer", action="store_true",
+                        help="enregistrer les mesures comme nouvelle référence")
+    parser.add_argument("--froid", action="store_true",
+                        help="mesurer la première exécution, construction des caches comprise")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="ralentissement toléré par rapport à la référence (défaut : 0.25)")
+    args = parser.parse_args(argv)
+    inconnus = [nom for nom in args.noms if nom not in GENERATEURS]
+    if inconnus:
+        parser.error(f"défi(s) sans benchmark : {', '.join(inconnus)}")
+
+    resultats = {}
+    for nom in args.noms or GENERATEURS:
+        resultats[nom] = mesurer(nom, args.tailles, args.delai, args.froid)
+        print(f"{nom} (exposant : {resultats[nom]['exposant'] or 0:.2f})")
+        for mesure in resultats[nom]["mesures"]:
+            if mesure["statut"] != OK:
+                print(f"    n={mesure['taille']:>10} {mesure['statut']}")
+                continue
+            print(f"    n={mesure['taille']:>10} {mesure['duree']:>9.3f} s "
+                  f"{mesure['debit']:>12.0f} enr./s "
+                  f"{(mesure['memoire_max'] or 0) / 2**20:>8.1f} Mo")
+
+    reference = {}
+    if os.path.exists(args.reference):
+        with open(args.reference, mode="r", encoding="utf-8") as f:
+            reference = json.load(f)
+
+    regressions = comparer(resultats, reference, args.tolerance)
+    for regression in regressions:
+        print(f"Régression : {regression}")
+
+    if args.enregistrer:
+        reference.update(resultats)
+        with open(args.reference, mode="w", encoding="utf-8") as f:
+            json.dump(reference, f, indent=2)
+
+    return len(regressions)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,191 @@
+"""Sums of two and of three squares, with integers only.
+
+Two squares: n = a² + b² means n = (a + bi)(a - bi) in the Gaussian
+integers. Each prime p = 1 (mod 4) splits as p = (x + yi)(x - yi), found
+by the Hermite-Serret algorithm; primes q = 3 (mod 4) must appear with an
+even exponent; 2 = -i(1 + i)². Every decomposition of n is a product of
+these Gaussian primes, so they are all built from the factorization of n.
+
+Three squares (Legendre): n is a sum of three squares unless n = 4^a(8b + 7).
+Up to N, there are (N // 4^a + 1) // 8 such numbers for each a, so they are
+counted without enumerating them.
+"""
+from collections.abc import Iterable
+from math import isqrt
+
+import numpy as np
+from numpy.typing import NDArray
+
+Gaussien = tuple[int, int]
+
+
+def crible_ppf(limite: int) -> NDArray:
+    """Smallest prime factor of every number up to a limit.
+
+    :param limite (int): largest number
+    :return (NDArray): smallest prime factor of each index, 0 for 0 and 1
+    """
+    ppf = np.zeros(limite + 1, dtype=np.int64)
+    for p in range(2, isqrt(limite) + 1):
+        if ppf[p] == 0:
+            multiples = ppf[p * p::p]
+            multiples[multiples == 0] = p
+    premiers = ppf == 0
+    premiers[:2] = False
+    ppf[premiers] = np.flatnonzero(premiers)
+
+    return ppf
+
+
+def factoriser(n: int, ppf: NDArray | None = None) -> dict[int, int]:
+    """Prime factorization.
+
+    :param n (int): number to factorize, positive
+    :param ppf (NDArray | None): smallest prime factors from crible_ppf,
+        trial division if None or too short
+    :return (dict[int, int]): exponent of each prime factor
+    """
+    facteurs: dict[int, int] = {}
+    if ppf is not None and n < len(ppf):
+        while n > 1:
+            p = int(ppf[n])
+            facteurs[p] = facteurs.get(p, 0) + 1
+            n //= p
+        return facteurs
+
+    p = 2
+    while p * p <= n:
+        while n % p == 0:
+            facteurs[p] = facteurs.get(p, 0) + 1
+            n //= p
+        p += 1 if p == 2 else 2
+    if n > 1:
+        facteurs[n] = facteurs.get(n, 0) + 1
+
+    return facteurs
+
+
+def premier_deux_carres(p: int) -> tuple[int, int]:
+    """Decomposition of a prime p = 1 (mod 4) as x² + y², by Hermite-Serret.
+
+    :param p (int): prime, 1 modulo 4
+    :return (tuple[int, int]): x and y, x > y > 0
+    """
+    # square root of -1 modulo p, from a quadratic non-residue
+    c = 2
+    while pow(c, (p - 1) // 2, p) != p - 1:
+        c += 1
+    racine = pow(c, (p - 1) // 4, p)
+
+    # Euclid's algorithm on p and the root, stopped below sqrt(p)
+    a, b = p, racine
+    limite = isqrt(p)
+    while b > limite:
+        a, b = b, a % b
+
+    return b, isqrt(p - b * b)
+
+
+def _multiplier(z: Gaussien, w: Gaussien) -> Gaussien:
+    """Product of two Gaussian integers.
+
+    :param z (Gaussien): real and imaginary parts
+    :param w (Gaussien): real and imaginary parts
+    :return (Gaussien): z * w
+    """
+    return z[0] * w[0] - z[1] * w[1], z[0] * w[1] + z[1] * w[0]
+
+
+def _puissance(z: Gaussien, exposant: int) -> Gaussien:
+    """Power of a Gaussian integer.
+
+    :param z (Gaussien): real and imaginary parts
+    :param exposant (int): power, positive or zero
+    :return (Gaussien): z to the power exposant
+    """
+    resultat = (1, 0)
+    for _ in range(exposant):
+        resultat = _multiplier(resultat, z)
+
+    return resultat
+
+
+def deux_carres(n: int, ppf: NDArray | None = None) -> list[tuple[int, int]]:
+    """All the ways to write n as a sum of two squares.
+
+    :param n (int): number to decompose, positive or zero
+    :param ppf (NDArray | None): smallest prime factors from crible_ppf, to factorize faster
+    :return (list[tuple[int, int]]): ordered pairs (a, b), a >= 0, b >= 0,
+        a² + b² = n, in increasing order of a
+    """
+    if n == 0:
+        return [(0, 0)]
+
+    # Gaussian integers whose norm is the part of n already handled
+    produits: list[Gaussien] = [(1, 0)]
+    for p, exposant in factoriser(n, ppf).items():
+        if p == 2:
+            facteurs = [_puissance((1, 1), exposant)]
+        elif p % 4 == 3:
+            if exposant % 2:
+                return []
+            facteurs = [(p ** (exposant // 2), 0)]
+        else:
+            x, y = premier_deux_carres(p)
+            # p = (x + yi)(x - yi): j factors x + yi, the others x - yi
+            facteurs = [_multiplier(_puissance((x, y), j), _puissance((x, -y), exposant - j))
+                        for j in range(exposant + 1)]
+        produits = [_multiplier(z, facteur) for z in produits for facteur in facteurs]
+
+    paires = set()
+    for x, y in produits:
+        # the 4 associates of x + yi: multiplied by 1, i, -1, -i
+        for a, b in ((x, y), (-y, x), (-x, -y), (y, -x)):
+            if a >= 0 and b >= 0:
+                paires.add((a, b))
+
+    return sorted(paires)
+
+
+def deux_carres_lot(nombres: Iterable[int]) -> dict[int, list[tuple[int, int]]]:
+    """Sums of two squares of many numbers, factorized with a single sieve.
+
+    :param nombres (Iterable[int]): numbers to decompose
+    :return (dict[int, list[tuple[int, int]]]): decompositions of each number, see deux_carres
+    """
+    nombres = list(nombres)
+    ppf = crible_ppf(max(nombres, default=1))
+    return {n: deux_carres(n, ppf) for n in nombres}
+
+
+def trois_carres(nombres: Iterable[int] | NDArray) -> NDArray:
+    """Which numbers are sums of three squares, by Legendre's theorem.
+
+    :param nombres (Iterable[int] | NDArray): numbers, positive or zero
+    :return (NDArray): boolean array, False for the numbers 4^a(8b + 7)
+    """
+    reste = np.array(nombres, dtype=np.int64)
+    # 4^a removed from every number at once
+    while True:
+        multiples = (reste % 4 == 0) & (reste > 0)
+        if not multiples.any():
+            break
+        reste[multiples] //= 4
+
+    return reste % 8 != 7
+
+
+def nb_non_trois_carres(maximum: int) -> int:
+    """Number of integers up to a bound that are not sums of three squares.
+
+    :param maximum (int): largest number
+    :return (int): number of integers 4^a(8b + 7) <= maximum
+    """
+    total = 0
+    puissance = 1
+    while puissance <= maximum:
+        # the numbers 8b + 7 <= maximum // 4^a
+        total += (maximum // puissance + 1) // 8
+        puissance *= 4
+
+    return total
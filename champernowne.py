@@ -0,0 +1,91 @@
+"""Digits of the Champernowne constant 0.123456789101112..., without building it.
+
+Position 1 is the first digit after the decimal point. The numbers written
+with L digits fill a block of 9 * 10^(L - 1) * L positions, so the number
+holding any position, and the digit in it, are found block by block. Digit
+sums over a range of positions come from the sum of the digits of all the
+numbers up to some bound, computed digit position by digit position:
+positions up to 10^18 cost a few dozen operations.
+"""
+from collections.abc import Iterable
+
+
+def localiser(position: int) -> tuple[int, int]:
+    """Number holding a position of the constant.
+
+    :param position (int): position of the digit, from 1
+    :return (tuple[int, int]): the number, and the index of the digit in it (0 for the first)
+    """
+    if position < 1:
+        raise ValueError("les positions commencent à 1.")
+
+    longueur, premier, taille_bloc = 1, 1, 9
+    while position > taille_bloc:
+        position -= taille_bloc
+        longueur += 1
+        premier *= 10
+        taille_bloc = 9 * premier * longueur
+
+    rang, indice = divmod(position - 1, longueur)
+    return premier + rang, indice
+
+
+def chiffre(position: int) -> int:
+    """Digit at a position of the constant.
+
+    :param position (int): position of the digit, from 1
+    :return (int): the digit
+    """
+    nombre, indice = localiser(position)
+    return int(str(nombre)[indice])
+
+
+def somme_chiffres_nombres(maximum: int) -> int:
+    """Sum of the digits of all the numbers from 0 to maximum.
+
+    :param maximum (int): largest number
+    :return (int): sum of the digits of 0, 1, ..., maximum
+    """
+    total = 0
+    puissance = 1
+    while puissance <= maximum:
+        # digits in the column of puissance, for the numbers 0 to maximum
+        haut, reste = divmod(maximum, puissance * 10)
+        courant, bas = divmod(reste, puissance)
+        total += haut * 45 * puissance + courant * (courant - 1) // 2 * puissance \
+            + courant * (bas + 1)
+        puissance *= 10
+
+    return total
+
+
+def somme_prefixe(position: int) -> int:
+    """Sum of the digits of the constant, from position 1 to a position.
+
+    :param position (int): last position, 0 for an empty sum
+    :return (int): sum of the digits up to position
+    """
+    if position == 0:
+        return 0
+
+    nombre, indice = localiser(position)
+    return somme_chiffres_nombres(nombre - 1) + sum(map(int, str(nombre)[:indice + 1]))
+
+
+def somme(debut: int, fin: int) -> int:
+    """Sum of the digits of the constant over a range of positions.
+
+    :param debut (int): first position, from 1
+    :param fin (int): last position, included
+    :return (int): sum of the digits from debut to fin
+    """
+    return somme_prefixe(fin) - somme_prefixe(debut - 1)
+
+
+def sommes(intervalles: Iterable[tuple[int, int]]) -> list[int]:
+    """Sums of the digits of the constant over many ranges of positions.
+
+    :param intervalles (Iterable[tuple[int, int]]): first and last position of each range
+    :return (list[int]): sum of the digits of each range
+    """
+    return [somme(debut, fin) for debut, fin in intervalles]
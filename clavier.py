@@ -0,0 +1,151 @@
+"""Phone keypad (T9) index: words stored by the number typed to write them.
+
+Words are converted to numbers with a translation table, in one call to
+str.translate, and stored in a trie of the digits of their number, packed in
+an array of integers. The index answers exact lookups, prefix lookups and
+the numbers shared by the most words.
+"""
+from array import array
+from collections.abc import Iterable, Iterator
+import heapq
+
+CADRAN = {
+    2: "ABC",
+    3: "DEF",
+    4: "GHI",
+    5: "JKL",
+    6: "MNO",
+    7: "PQRS",
+    8: "TUV",
+    9: "WXYZ",
+}
+
+
+class _TableCadran(dict):
+    """Translation table of the keypad: characters missing from the keypad are removed."""
+    def __missing__(self, caractere: int) -> None:
+        return None
+
+
+TABLE = _TableCadran({ord(lettre): str(chiffre)
+                      for chiffre, lettres in CADRAN.items() for lettre in lettres})
+# digits of the keypad, in the order of the children of a node of the trie
+CHIFFRES = "".join(str(chiffre) for chiffre in CADRAN)
+PREMIER = ord(CHIFFRES[0])
+VIDE = array("i", [0] * len(CHIFFRES))
+# children of a node with a given mask: slot and digit, the largest digit first
+ENFANTS = [tuple((case, CHIFFRES[case]) for case in reversed(range(len(CHIFFRES)))
+                 if masque >> case & 1) for masque in range(1 << len(CHIFFRES))]
+
+
+def numero(mot: str) -> str:
+    """Number typed on a keypad to write a word.
+
+    :param mot (str): word to convert, characters not on the keypad are ignored
+    :return (str): digits of the number
+    """
+    return mot.upper().translate(TABLE)
+
+
+class IndexT9:
+    """Words indexed by their keypad number, in a trie of digits.
+
+    The trie is packed in a single array of 32-bit integers: the children of
+    node i, for the digits 2 to 9, are at self._enfants[8 * i:8 * i + 8],
+    0 when there is no child (the root, node 0, is no one's child), and bit d
+    of self._masques[i] is set when slot d holds a child. The words whose
+    number ends on node i are in self._mots[i].
+
+    :param mots (Iterable[str]): words to index, in one pass
+    """
+    def __init__(self, mots: Iterable[str] = ()) -> None:
+        self._enfants = array("i", VIDE)
+        self._masques = bytearray(1)
+        self._mots: list[list[str] | None] = [None]
+        self.nb_numeros = 0
+        for mot in mots:
+            self.ajouter(mot)
+
+    def ajouter(self, mot: str) -> None:
+        """Add a word to the index.
+
+        :param mot (str): word to add
+        """
+        enfants = self._enfants
+        noeud = 0
+        # the digits as bytes, that is as integers
+        for chiffre in numero(mot).encode("ascii"):
+            case = chiffre - PREMIER
+            suivant = enfants[8 * noeud + case]
+            if not suivant:
+                suivant = enfants[8 * noeud + case] = len(self._mots)
+                self._masques[noeud] |= 1 << case
+                enfants.extend(VIDE)
+                self._masques.append(0)
+                self._mots.append(None)
+            noeud = suivant
+
+        if self._mots[noeud] is None:
+            self._mots[noeud] = []
+            self.nb_numeros += 1
+        self._mots[noeud].append(mot)
+
+    def _noeud(self, chiffres: str) -> int | None:
+        """Node reached by a sequence of digits.
+
+        :param chiffres (str): digits from the root
+        :return (int | None): index of the node, None if no word has this prefix
+        """
+        noeud = 0
+        for chiffre in chiffres:
+            if chiffre not in CHIFFRES:
+                return None
+            noeud = self._enfants[8 * noeud + ord(chiffre) - PREMIER]
+            if not noeud:
+                return None
+
+        return noeud
+
+    def mots(self, chiffres: str) -> list[str]:
+        """Words written with exactly this number.
+
+        :param chiffres (str): digits of the number
+        :return (list[str]): words, in insertion order
+        """
+        noeud = self._noeud(chiffres)
+        if noeud is None:
+            return []
+
+        return list(self._mots[noeud] or [])
+
+    def prefixe(self, chiffres: str) -> Iterator[tuple[str, list[str]]]:
+        """Numbers starting with some digits, with their words.
+
+        :param chiffres (str): first digits of the numbers
+        :return (Iterator[tuple[str, list[str]]]): numbers in increasing
+            lexicographic order, with their words
+        """
+        depart = self._noeud(chiffres)
+        if depart is None:
+            return
+
+        pile = [(depart, chiffres)]
+        while pile:
+            noeud, numero_noeud = pile.pop()
+            if self._mots[noeud]:
+                yield numero_noeud, self._mots[noeud]
+            # the smallest digit on top of the stack
+            for case, chiffre in ENFANTS[self._masques[noeud]]:
+                pile.append((self._enfants[8 * noeud + case], numero_noeud + chiffre))
+
+    def plus_ambigus(self, k: int) -> list[tuple[str, list[str]]]:
+        """Numbers shared by the most words.
+
+        :param k (int): number of numbers to return
+        :return (list[tuple[str, list[str]]]): the k numbers with the most words,
+            most shared first, the smallest number first on ties
+        """
+        return heapq.nlargest(k, self.prefixe(""), key=lambda item: len(item[1]))
+
+    def __len__(self) -> int:
+        return self.nb_numeros
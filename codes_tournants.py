@@ -0,0 +1,90 @@
+"""Rolling codes: each code, multiplied rounds times by a multiplier modulo m,
+gives back the previous code.
+
+code_precedent = code * multiplicateur^tours (mod m), so the next code is
+found directly with the modular inverse of multiplicateur^tours, instead of
+trying every code. Long code sequences are checked with NumPy, all codes at once.
+"""
+from collections.abc import Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+
+MULTIPLICATEUR = 5231
+TOURS = 20
+MODULO = 999671
+
+
+def cle(multiplicateur: int = MULTIPLICATEUR, tours: int = TOURS,
+        modulo: int = MODULO) -> int:
+    """Factor applied to a code by all the rounds.
+
+    :param multiplicateur (int): factor of one round
+    :param tours (int): number of rounds
+    :param modulo (int): modulo of the codes
+    :return (int): multiplicateur^tours mod modulo
+    """
+    return pow(multiplicateur, tours, modulo)
+
+
+def code_suivant(code_precedent: int, multiplicateur: int = MULTIPLICATEUR,
+                 tours: int = TOURS, modulo: int = MODULO) -> int:
+    """Code following a code.
+
+    :param code_precedent (int): previous code
+    :param multiplicateur (int): factor of one round
+    :param tours (int): number of rounds
+    :param modulo (int): modulo of the codes
+    :return (int): the only code from 0 to modulo - 1 validated by code_precedent
+    """
+    # raises ValueError if the key has no inverse modulo modulo
+    inverse = pow(cle(multiplicateur, tours, modulo), -1, modulo)
+    return code_precedent * inverse % modulo
+
+
+def verifier(code_precedent: int, code_propose: int, multiplicateur: int = MULTIPLICATEUR,
+             tours: int = TOURS, modulo: int = MODULO) -> bool:
+    """Check a proposed code against the previous one.
+
+    :param code_precedent (int): previous code
+    :param code_propose (int): proposed code
+    :param multiplicateur (int): factor of one round
+    :param tours (int): number of rounds
+    :param modulo (int): modulo of the codes
+    :return (bool): True if code_propose gives back code_precedent
+    """
+    return code_propose * cle(multiplicateur, tours, modulo) % modulo == code_precedent
+
+
+def verifier_lot(codes_precedents: Sequence[int] | NDArray,
+                 codes_proposes: Sequence[int] | NDArray,
+                 multiplicateur: int = MULTIPLICATEUR, tours: int = TOURS,
+                 modulo: int = MODULO) -> NDArray:
+    """Check many proposed codes at once.
+
+    :param codes_precedents (Sequence[int] | NDArray): previous codes, or a single one
+    :param codes_proposes (Sequence[int] | NDArray): proposed codes
+    :param multiplicateur (int): factor of one round
+    :param tours (int): number of rounds
+    :param modulo (int): modulo of the codes
+    :return (NDArray): boolean array, True for the proposed codes giving back
+        their previous code
+    """
+    if modulo >= 1 << 31:
+        raise ValueError("le modulo doit être inférieur à 2^31 pour les calculs en int64.")
+    proposes = np.asarray(codes_proposes, dtype=np.int64) % modulo
+    return proposes * cle(multiplicateur, tours, modulo) % modulo == np.asarray(codes_precedents)
+
+
+def verifier_chaine(codes: Sequence[int] | NDArray, multiplicateur: int = MULTIPLICATEUR,
+                    tours: int = TOURS, modulo: int = MODULO) -> NDArray:
+    """Check a sequence of codes, each one against the previous one.
+
+    :param codes (Sequence[int] | NDArray): codes, in order of use
+    :param multiplicateur (int): factor of one round
+    :param tours (int): number of rounds
+    :param modulo (int): modulo of the codes
+    :return (NDArray): boolean array, True for codes[i + 1] validated by codes[i]
+    """
+    codes = np.asarray(codes, dtype=np.int64)
+    return verifier_lot(codes[:-1], codes[1:], multiplicateur, tours, modulo)
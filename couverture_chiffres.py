@@ -0,0 +1,175 @@
+"""Digits used by the square and the cube of every integer of a range, as bitmasks.
+
+Bit d of a mask is set when digit d is written in x² or x³. The numbers are
+handled by blocks, as NumPy arrays of base 10^6 limbs (least significant
+first): x² and x³ are computed with limb products and carries, and the mask
+of each limb is read from a table of the 10^6 possible limbs, with the
+leading zeros of the top limb left out. Only when x does not fit in int64
+are Python integers used.
+
+A predicate selects the masks to keep, and the blocks of a range are spread
+over several processes, the numbers found being yielded in increasing order.
+"""
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+
+import numpy as np
+from numpy.typing import NDArray
+
+CHIFFRES_LIMBE = 6
+BASE = 10 ** CHIFFRES_LIMBE
+TAILLE_BLOC = 1 << 18
+# x² and x³ of larger numbers are computed with Python integers
+MAXI_NUMPY = np.iinfo(np.int64).max
+
+Predicat = Callable[[NDArray], NDArray]
+
+
+def _tables() -> tuple[NDArray, NDArray]:
+    """Digit masks of all the limbs.
+
+    :return (tuple[NDArray, NDArray]): masks of the limbs written with
+        6 digits (leading zeros included), and without leading zeros
+    """
+    limbes = np.arange(BASE, dtype=np.int64)
+    avec_zeros = np.zeros(BASE, dtype=np.uint16)
+    sans_zeros = np.zeros(BASE, dtype=np.uint16)
+    for rang in range(CHIFFRES_LIMBE):
+        bits = (1 << (limbes // 10 ** rang % 10)).astype(np.uint16)
+        avec_zeros |= bits
+        # a digit is written if the limb has more digits than its rank, or for 0 itself
+        sans_zeros |= np.where((limbes >= 10 ** rang) | ((limbes == 0) & (rang == 0)), bits, 0)
+
+    return avec_zeros, sans_zeros
+
+
+MASQUES_AVEC_ZEROS, MASQUES_SANS_ZEROS = _tables()
+
+
+class Couvre:
+    """Predicate: the mask has all the digits of a set.
+
+    :param chiffres (str): digits that must all be written, "0123456789" for pandigital
+    """
+    def __init__(self, chiffres: str = "0123456789") -> None:
+        self.chiffres = chiffres
+        self.masque = sum(1 << int(chiffre) for chiffre in set(chiffres))
+
+    def __call__(self, masques: NDArray) -> NDArray:
+        return masques & self.masque == self.masque
+
+
+PANDIGITAL = Couvre("0123456789")
+CHIFFRES_1_9 = Couvre("123456789")
+
+
+def _limbes(nombres: NDArray, nb_limbes: int) -> NDArray:
+    """Limbs of numbers.
+
+    :param nombres (NDArray): numbers, int64
+    :param nb_limbes (int): number of limbs
+    :return (NDArray): limbs, one row per number, least significant first
+    """
+    limbes = np.empty((len(nombres), nb_limbes), dtype=np.int64)
+    reste = nombres.copy()
+    for rang in range(nb_limbes):
+        reste, limbes[:, rang] = np.divmod(reste, BASE)
+
+    return limbes
+
+
+def _produit(a: NDArray, b: NDArray) -> NDArray:
+    """Products of numbers given by their limbs, row by row.
+
+    :param a (NDArray): limbs of the first factors
+    :param b (NDArray): limbs of the second factors
+    :return (NDArray): limbs of the products
+    """
+    produit = np.zeros((len(a), a.shape[1] + b.shape[1]), dtype=np.int64)
+    for rang in range(a.shape[1]):
+        produit[:, rang:rang + b.shape[1]] += a[:, rang:rang + 1] * b
+    for rang in range(produit.shape[1] - 1):
+        retenue, produit[:, rang] = np.divmod(produit[:, rang], BASE)
+        produit[:, rang + 1] += retenue
+
+    return produit
+
+
+def _masques_limbes(limbes: NDArray) -> NDArray:
+    """Digit masks of numbers given by their limbs.
+
+    :param limbes (NDArray): limbs, one row per number, least significant first
+    :return (NDArray): mask of each number
+    """
+    # index of the most significant non-zero limb, 0 for the number 0
+    non_nuls = limbes != 0
+    haut = limbes.shape[1] - 1 - np.argmax(non_nuls[:, ::-1], axis=1)
+    haut[~non_nuls.any(axis=1)] = 0
+
+    masques = np.zeros(len(limbes), dtype=np.uint16)
+    for rang in range(limbes.shape[1]):
+        limbe = limbes[:, rang]
+        masques |= np.where(rang < haut, MASQUES_AVEC_ZEROS[limbe],
+                            np.where(rang == haut, MASQUES_SANS_ZEROS[limbe], 0))
+
+    return masques
+
+
+def masques(mini: int, maxi: int) -> NDArray:
+    """Digit masks of x² and x³ for every x of a range.
+
+    :param mini (int): first number, positive or zero
+    :param maxi (int): last number, included
+    :return (NDArray): mask of the digits of x² and x³, for x from mini to maxi
+    """
+    if maxi > MAXI_NUMPY:
+        resultat = np.zeros(maxi - mini + 1, dtype=np.uint16)
+        for idx, x in enumerate(range(mini, maxi + 1)):
+            for chiffre in set(str(x * x)) | set(str(x * x * x)):
+                resultat[idx] |= 1 << int(chiffre)
+        return resultat
+
+    nombres = np.arange(mini, maxi + 1, dtype=np.int64)
+    x = _limbes(nombres, -(-len(str(maxi)) // CHIFFRES_LIMBE))
+    carres = _produit(x, x)
+    cubes = _produit(carres, x)
+
+    return _masques_limbes(carres) | _masques_limbes(cubes)
+
+
+def _bloc(mini: int, maxi: int, predicat: Predicat) -> list[int]:
+    """Numbers of a block whose mask meets the predicate.
+
+    :param mini (int): first number of the block
+    :param maxi (int): last number of the block, included
+    :param predicat (Predicat): condition on an array of masks
+    :return (list[int]): numbers found, in increasing order
+    """
+    return (mini + np.flatnonzero(predicat(masques(mini, maxi)))).tolist()
+
+
+def scanner(mini: int, maxi: int, predicat: Predicat = PANDIGITAL,
+            processus: int | None = None, taille_bloc: int = TAILLE_BLOC) -> Iterator[int]:
+    """Numbers of a range whose square and cube write some digits.
+
+    :param mini (int): first number, positive or zero
+    :param maxi (int): last number, included
+    :param predicat (Predicat): condition on an array of masks, it must be
+        picklable (a Couvre, not a lambda) to be sent to the processes
+    :param processus (int | None): number of processes, number of CPUs if None
+    :param taille_bloc (int): number of integers of each block
+    :return (Iterator[int]): numbers found, in increasing order, as soon as
+        their block is scanned
+    """
+    debuts = list(range(mini, maxi + 1, taille_bloc))
+    fins = [min(debut + taille_bloc - 1, maxi) for debut in debuts]
+    if multiprocessing.current_process().daemon:
+        # a daemon process cannot have children: the blocks are scanned here
+        for debut, fin in zip(debuts, fins):
+            yield from _bloc(debut, fin, predicat)
+        return
+
+    with ProcessPoolExecutor(max_workers=processus) as executeur:
+        for trouves in executeur.map(_bloc, debuts, fins, [predicat] * len(debuts)):
+            yield from trouves
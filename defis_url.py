@@ -1,11 +1,153 @@
-import requests
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+import hashlib
+import json
+import os
 import re
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+__version__ = "1.3a"
+
+TIMEOUT = 30
+TENTATIVES = 3
+ATTENTE = 0.5
+CONCURRENCE = 8
+# the same root as the caches of mots.py, moved elsewhere with PYDEFIS_CACHE
+RACINE_CACHE = os.environ.get("PYDEFIS_CACHE",
+                              os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache"))
+DOSSIER_CACHE = os.path.join(RACINE_CACHE, "reponses")
+
+
+def creer_session(tentatives=TENTATIVES, attente=ATTENTE, connexions=CONCURRENCE):
+    """Create a session keeping its connections open between requests.
+
+    - tentatives: number of retries on connection errors and 5xx answers\n
+    - attente: backoff factor between retries, in seconds (0.5, 1, 2, ...)\n
+    - connexions: number of connections kept open for each host\n
+    Return the session
+    """
+    reprises = Retry(total=tentatives, backoff_factor=attente,
+                     status_forcelist=(500, 502, 503, 504))
+    adaptateur = HTTPAdapter(pool_connections=connexions, pool_maxsize=connexions,
+                             max_retries=reprises)
+    session = requests.Session()
+    session.mount("http://", adaptateur)
+    session.mount("https://", adaptateur)
+    session.connexions = connexions
+    return session
+
+
+def agrandir_session(session, connexions):
+    """Keep more connections open in a session created by creer_session, if needed.
+
+    - session: session to enlarge, its retries are kept\n
+    - connexions: number of connections kept open for each host\n
+    Sessions not created by creer_session are left unchanged
+    """
+    if getattr(session, "connexions", connexions) >= connexions:
+        return
+    reprises = session.get_adapter("https://").max_retries
+    adaptateur = HTTPAdapter(pool_connections=connexions, pool_maxsize=connexions,
+                             max_retries=reprises)
+    session.mount("http://", adaptateur)
+    session.mount("https://", adaptateur)
+    session.connexions = connexions
+
+
+class CacheReponses():
+    """Answers of the GET requests saved on disk, one JSON file per url.
+
+    - dossier: folder of the saved answers\n
+    - duree: time in seconds during which a saved answer is used\n
+    - taille_max: number of answers kept, the least recently used are removed
+    """
+    def __init__(self, dossier=DOSSIER_CACHE, duree=24 * 3600, taille_max=256):
+        self.dossier = dossier
+        self.duree = duree
+        self.taille_max = taille_max
+        self.succes = 0
+        self.echecs = 0
+        # get_tous() reads and writes the same cache from several threads
+        self._verrou = threading.Lock()
+        os.makedirs(self.dossier, exist_ok=True)
+
+    def _fichier(self, url):
+        return os.path.join(self.dossier, hashlib.sha256(url.encode()).hexdigest() + ".json")
+
+    def lire(self, url):
+        """Return the saved text answered to url, None if missing or too old."""
+        fichier = self._fichier(url)
+        try:
+            with open(fichier, encoding="utf-8") as f:
+                reponse = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            reponse = None
+
+        if reponse is None or time.time() - reponse["date"] > self.duree:
+            with self._verrou:
+                self.echecs += 1
+            return None
+
+        # the modification time of the file is its last use
+        try:
+            os.utime(fichier)
+        except FileNotFoundError:
+            # removed by another thread or process since it was read
+            pass
+        with self._verrou:
+            self.succes += 1
+        return reponse["text"]
 
-__version__ = "1.2a"
+    def ecrire(self, url, text):
+        """Save the text answered to url, and remove the least recently used answers."""
+        fichier = self._fichier(url)
+        # unique for each process and thread
+        temporaire = f"{fichier}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temporaire, "w", encoding="utf-8") as f:
+            json.dump({"url": url, "date": time.time(), "text": text}, f, ensure_ascii=False)
+
+        with self._verrou:
+            os.replace(temporaire, fichier)
+
+            dates = {}
+            for nom in os.listdir(self.dossier):
+                if nom.endswith(".json"):
+                    chemin = os.path.join(self.dossier, nom)
+                    try:
+                        dates[chemin] = os.path.getmtime(chemin)
+                    except FileNotFoundError:
+                        # already removed by another process
+                        pass
+            if len(dates) > self.taille_max:
+                for ancien in sorted(dates, key=dates.get)[:len(dates) - self.taille_max]:
+                    try:
+                        os.remove(ancien)
+                    except FileNotFoundError:
+                        pass
+
+    def vider(self):
+        """Remove all the saved answers."""
+        with self._verrou:
+            for nom in os.listdir(self.dossier):
+                if nom.endswith(".json"):
+                    try:
+                        os.remove(os.path.join(self.dossier, nom))
+                    except FileNotFoundError:
+                        pass
 
 
 class DefisUrl():
-    def __init__(self, urlget, urlpost=None, debug=False, proxy=None, verify=False):
+    # shared by all the challenges, so that connections are reused
+    _session = None
+
+    def __init__(self, urlget, urlpost=None, debug=False, proxy=None, verify=False,
+                 session=None, timeout=TIMEOUT, cache=None):
         self.urlget = urlget
         self.urlpost = urlpost
         self.signature = None
@@ -13,34 +155,103 @@ class DefisUrl():
         self.debug = debug
         self.proxies = dict()
         self.verify = verify
+        self.session = session
+        self.timeout = timeout
+        # CacheReponses, to avoid downloading the statement again while developping
+        self.cache = cache
         if proxy is not None:
             self.proxies['http'] = proxy
             self.proxies['https'] = proxy
         if self.urlpost == None:
             self.urlpost = re.sub('/get/', '/post/', self.urlget)
 
-    def get(self):
-        question = requests.get(
-            self.urlget, verify=self.verify, proxies=self.proxies)
-        if self.debug:  # on peut afficher le code de retour de la requête :
-            print('GET:', question)
-            # et le texte récupéré (qui contient la signature et l'énoncé) :
-            print('TEXT:', question.text)
+    def _get_session(self):
+        if self.session is None:
+            if DefisUrl._session is None:
+                DefisUrl._session = creer_session()
+            self.session = DefisUrl._session
+        return self.session
+
+    def get(self, utiliser_cache=True):
+        # utiliser_cache=False downloads a fresh signature, before the final post()
+        texte = None
+        if self.cache is not None and utiliser_cache:
+            texte = self.cache.lire(self.urlget)
+        if texte is None:
+            question = self._get_session().get(
+                self.urlget, verify=self.verify, proxies=self.proxies, timeout=self.timeout)
+            if self.debug:  # on peut afficher le code de retour de la requête :
+                print('GET:', question)
+                # et le texte récupéré (qui contient la signature et l'énoncé) :
+                print('TEXT:', question.text)
+            texte = question.text
+            # error pages are returned like before, but not saved
+            if self.cache is not None and question.ok:
+                self.cache.ecrire(self.urlget, texte)
+        self.text = texte
         # on sépare les lignes de l'entrée
-        lignes = question.text.split("\n")
+        lignes = texte.split("\n")
         # print(lignes)
         # la première ligne contient la signature
         self.signature = lignes[0]
         return lignes[1:]
 
     def post(self, reponse):
-        res = requests.post(self.urlpost, verify=self.verify,
-                            data={"sig": self.signature, "rep": reponse},
-                            proxies=self.proxies)
+        res = self._get_session().post(self.urlpost, verify=self.verify,
+                                       data={"sig": self.signature, "rep": reponse},
+                                       proxies=self.proxies, timeout=self.timeout)
         if self.debug:
             print(res)
             print(res.text)
         return res.text
 
 
+def _preparer_sessions(defis, concurrence):
+    """Give each challenge its session, with a pool as large as concurrence.
+
+    Done before the threads start, so that they share the same sessions.
+    """
+    for defi in defis:
+        agrandir_session(defi._get_session(), concurrence)
+
+
+async def _executer_tous(appels, concurrence):
+    """Run blocking calls in threads, at most concurrence at once.
+
+    - appels: functions without arguments\n
+    - concurrence: maximum number of simultaneous calls\n
+    Return the result of each call, in the order of appels
+    """
+    boucle = asyncio.get_running_loop()
+    with ThreadPoolExecutor(max_workers=concurrence) as executeur:
+        return await asyncio.gather(
+            *(boucle.run_in_executor(executeur, appel) for appel in appels))
+
+
+async def get_tous(defis, concurrence=CONCURRENCE):
+    """Fetch the statements of several challenges at once.
+
+    - defis: challenges to fetch\n
+    - concurrence: maximum number of simultaneous requests, the pool of the
+      shared session is enlarged to keep as many connections open\n
+    Return the lines of each statement, in the order of defis
+    """
+    _preparer_sessions(defis, concurrence)
+    return await _executer_tous([defi.get for defi in defis], concurrence)
+
+
+async def post_tous(defis, reponses, concurrence=CONCURRENCE):
+    """Submit the answers of several challenges at once.
+
+    - defis: challenges, already fetched\n
+    - reponses: answer of each challenge\n
+    - concurrence: maximum number of simultaneous requests, the pool of the
+      shared session is enlarged to keep as many connections open\n
+    Return the text answered for each challenge, in the order of defis
+    """
+    _preparer_sessions(defis, concurrence)
+    return await _executer_tous(
+        [partial(defi.post, reponse) for defi, reponse in zip(defis, reponses)], concurrence)
+
+
 print("defiurl.py version", __version__)
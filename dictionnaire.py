@@ -0,0 +1,124 @@
+"""Letter counts of a whole word list as NumPy arrays.
+
+A Dictionnaire precomputes, for every word of a list:
+- comptes: number of occurrences of each letter of the alphabet (words x alphabet,
+  uint8 unless a word is longer than 255 characters)
+- longueurs: length of the word
+- lettres: letter at each position, as index in the alphabet plus one
+  (0 after the end of the word, len(alphabet) + 1 for other characters)
+
+Queries like "exactly one t, h, o and r" or "e in 3rd position" then become
+array expressions on the whole list, instead of Python loops on the words.
+"""
+from collections.abc import Sequence
+import string
+
+import numpy as np
+from numpy.typing import NDArray
+
+from mots import ListeMots
+
+TAILLE_BLOC = 50_000
+
+
+class Dictionnaire:
+    """Letter count matrix of a word list.
+
+    :param mots (Sequence[str]): words, a ListeMots or any sequence of strings
+    :param alphabet (str): letters counted
+    :param ignorer_casse (bool): count upper case letters as lower case ones
+    """
+    def __init__(self, mots: Sequence[str], alphabet: str = string.ascii_lowercase,
+                 ignorer_casse: bool = False) -> None:
+        self.mots = mots
+        self.alphabet = alphabet
+        self.ignorer_casse = ignorer_casse
+        self._colonnes = {lettre: idx for idx, lettre in enumerate(alphabet)}
+
+        if isinstance(mots, ListeMots):
+            # words are already stored one per line, in UTF-8
+            texte = str(mots.blob, "utf-8")
+        else:
+            texte = "".join(f"{mot}\n" for mot in mots)
+        if ignorer_casse:
+            texte = texte.lower()
+
+        # one code point per character, so that positions are in characters
+        points = np.frombuffer(texte.encode("utf-32-le"), dtype=np.uint32)
+        fins = np.flatnonzero(points == ord("\n"))
+        debuts = np.concatenate(([0], fins[:-1] + 1))
+        self.longueurs = fins - debuts
+
+        # column of each character in the alphabet, len(alphabet) if not in it
+        codes = np.array([ord(lettre) for lettre in alphabet], dtype=np.uint32)
+        ordre = np.argsort(codes)
+        rang = np.minimum(np.searchsorted(codes[ordre], points), len(codes) - 1)
+        colonnes = np.where(codes[ordre][rang] == points, ordre[rang], len(codes))
+
+        nb_mots, nb_lettres = len(fins), len(alphabet)
+        longueur_max = int(self.longueurs.max(initial=0))
+        # the smallest types holding the longest word and the last code, without wrapping
+        self.comptes = np.zeros((nb_mots, nb_lettres), dtype=np.min_scalar_type(longueur_max))
+        self.lettres = np.zeros((nb_mots, longueur_max), dtype=np.min_scalar_type(nb_lettres + 1))
+
+        for premier in range(0, nb_mots, TAILLE_BLOC):
+            dernier = min(nb_mots, premier + TAILLE_BLOC)
+            debut, fin = debuts[premier], fins[dernier - 1]
+            # word of each character of the block, the newline being excluded
+            mot = np.repeat(np.arange(premier, dernier), self.longueurs[premier:dernier] + 1)
+            caracteres = points[debut:fin + 1] != ord("\n")
+            mot = mot[caracteres]
+            colonne = colonnes[debut:fin + 1][caracteres]
+            position = np.arange(debut, fin + 1)[caracteres] - debuts[mot]
+
+            self.lettres[mot, position] = colonne + 1
+            dans_alphabet = colonne < nb_lettres
+            comptes = np.bincount((mot[dans_alphabet] - premier) * nb_lettres
+                                  + colonne[dans_alphabet],
+                                  minlength=(dernier - premier) * nb_lettres)
+            self.comptes[premier:dernier] = comptes.reshape(-1, nb_lettres)
+
+    def __len__(self) -> int:
+        return len(self.longueurs)
+
+    def _colonne(self, lettre: str) -> int:
+        """Column of a letter in the count matrix.
+
+        :param lettre (str): letter of the alphabet
+        :return (int): index of the letter in the alphabet
+        """
+        if self.ignorer_casse:
+            lettre = lettre.lower()
+        try:
+            return self._colonnes[lettre]
+        except KeyError:
+            raise ValueError(f"'{lettre}' n'est pas dans l'alphabet du dictionnaire.") from None
+
+    def compte(self, lettres: str) -> NDArray:
+        """Number of occurrences of some letters in every word.
+
+        :param lettres (str): letters to count, "aeiouy" to count vowels
+        :return (NDArray): total number of occurrences of the letters, for every word
+        """
+        colonnes = [self._colonne(lettre) for lettre in lettres]
+        return self.comptes[:, colonnes].sum(axis=1, dtype=np.int64)
+
+    def a_la_position(self, lettre: str, position: int) -> NDArray:
+        """Which words have a letter at a position.
+
+        :param lettre (str): letter of the alphabet
+        :param position (int): position in the word, starting from 0
+        :return (NDArray): boolean array, True for the words having lettre at position
+        """
+        if position >= self.lettres.shape[1]:
+            return np.zeros(len(self), dtype=bool)
+
+        return self.lettres[:, position] == self._colonne(lettre) + 1
+
+    def selection(self, masque: NDArray) -> list[str]:
+        """Words selected by a boolean array.
+
+        :param masque (NDArray): boolean array, one value per word
+        :return (list[str]): the selected words
+        """
+        return [self.mots[idx] for idx in np.flatnonzero(masque)]
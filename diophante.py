@@ -0,0 +1,104 @@
+"""Positive solutions of the linear Diophantine equation p * a + q * b = n.
+
+The extended Euclidean algorithm gives one solution, and all the others
+follow by steps of (q / g, -p / g), g = gcd(p, q): the positive solutions
+are an arithmetic progression, described by its first term, its step and
+its length. No pair (a, b) is tried, so n = 10^12 costs the same as n = 3188.
+"""
+from collections.abc import Iterable, Iterator
+from typing import NamedTuple
+
+
+def euclide_etendu(a: int, b: int) -> tuple[int, int, int]:
+    """Extended Euclidean algorithm.
+
+    :param a (int): first integer
+    :param b (int): second integer
+    :return (tuple[int, int, int]): g = gcd(a, b), x and y such that a * x + b * y = g
+    """
+    x0, y0, x1, y1 = 1, 0, 0, 1
+    while b:
+        quotient, reste = divmod(a, b)
+        a, b = b, reste
+        x0, x1 = x1, x0 - quotient * x1
+        y0, y1 = y1, y0 - quotient * y1
+
+    return a, x0, y0
+
+
+class Solutions(NamedTuple):
+    """Positive solutions a = a + k * pas_a, b = b - k * pas_b, for k from 0 to nombre - 1."""
+    a: int
+    b: int
+    pas_a: int
+    pas_b: int
+    nombre: int
+
+    def paires(self) -> Iterator[tuple[int, int]]:
+        """All the solutions.
+
+        :return (Iterator[tuple[int, int]]): pairs (a, b), a increasing
+        """
+        return ((self.a + k * self.pas_a, self.b - k * self.pas_b) for k in range(self.nombre))
+
+
+class Equation:
+    """Equation p * a + q * b = n, for any n, with a >= 1 and b >= 1.
+
+    :param p (int): coefficient of a, positive
+    :param q (int): coefficient of b, positive
+    """
+    def __init__(self, p: int, q: int) -> None:
+        if p <= 0 or q <= 0:
+            raise ValueError("les coefficients p et q doivent être positifs.")
+        self.p = p
+        self.q = q
+        # computed once for all the targets n
+        self.pgcd, self._x, self._y = euclide_etendu(p, q)
+        self.pas_a = q // self.pgcd
+        self.pas_b = p // self.pgcd
+
+    def solutions(self, n: int) -> Solutions:
+        """All the positive solutions.
+
+        :param n (int): target
+        :return (Solutions): the solutions, a increasing; nombre is 0 if there is none
+        """
+        if n % self.pgcd:
+            return Solutions(0, 0, self.pas_a, self.pas_b, 0)
+
+        facteur = n // self.pgcd
+        a, b = self._x * facteur, self._y * facteur
+        # smallest a >= 1
+        k = -((a - 1) // self.pas_a)
+        a, b = a + k * self.pas_a, b - k * self.pas_b
+        nombre = (b - 1) // self.pas_b + 1 if b >= 1 else 0
+
+        return Solutions(a, b, self.pas_a, self.pas_b, nombre)
+
+    def plus_proche(self, n: int) -> tuple[int, int] | None:
+        """Positive solution with the smallest |a - b|, in O(1).
+
+        :param n (int): target
+        :return (tuple[int, int] | None): a and b, the smallest a on ties;
+            None if there is no positive solution
+        """
+        solutions = self.solutions(n)
+        if not solutions.nombre:
+            return None
+
+        # a - b grows by pas_a + pas_b at each step: the best k is next to where it is 0
+        ecart, pas_ecart = solutions.a - solutions.b, self.pas_a + self.pas_b
+        milieu = -ecart // pas_ecart
+        candidats = {min(max(k, 0), solutions.nombre - 1) for k in (milieu, milieu + 1)}
+        k = min(candidats, key=lambda k: (abs(ecart + k * pas_ecart), k))
+
+        return solutions.a + k * self.pas_a, solutions.b - k * self.pas_b
+
+    def plus_proches(self, cibles: Iterable[int]) -> list[tuple[int, int] | None]:
+        """Positive solutions with the smallest |a - b|, for many targets.
+
+        :param cibles (Iterable[int]): targets n
+        :return (list[tuple[int, int] | None]): solution of each target, see plus_proche
+        """
+        return [self.plus_proche(n) for n in cibles]
@@ -0,0 +1,118 @@
+"""Fibonacci terms and their digit sums, far in the sequence.
+
+Only the last two terms are kept, as NumPy arrays of base 10^4 limbs (least
+significant first). The next term is computed in place with one array
+addition and a carry propagation, and its digit sum is read from a table of
+the digit sums of the 10^4 possible limbs: the huge integers are never
+converted to decimal strings.
+"""
+from collections.abc import Iterator
+
+import numpy as np
+
+CHIFFRES_LIMBE = 4
+BASE = 10 ** CHIFFRES_LIMBE
+# digit sum of every limb
+SOMMES = np.array([sum(map(int, str(limbe))) for limbe in range(BASE)], dtype=np.uint8)
+
+
+class Fibonacci:
+    """Fibonacci sequence, F(0) = 0, F(1) = 1, stepped one term at a time.
+
+    self.index is the index of the current term.
+    """
+    def __init__(self) -> None:
+        self.index = 0
+        self._capacite = 64
+        # self._termes[self._courant] is F(index), the other one F(index + 1)
+        self._termes = np.zeros((2, self._capacite), dtype=np.int32)
+        self._termes[1, 0] = 1
+        self._courant = 0
+        self._longueur = 1
+
+    def avancer(self) -> None:
+        """Step to the next term: F(index + 2) = F(index) + F(index + 1)
+        is written over F(index)."""
+        if self._longueur + 1 >= self._capacite:
+            self._termes = np.concatenate((self._termes, np.zeros_like(self._termes)), axis=1)
+            self._capacite *= 2
+
+        somme = self._termes[self._courant]
+        somme[:self._longueur] += self._termes[1 - self._courant, :self._longueur]
+        # each limb is below 2 * BASE, so the carries are 0 or 1
+        while True:
+            debordes = np.flatnonzero(somme[:self._longueur] >= BASE)
+            if not debordes.size:
+                break
+            somme[debordes] -= BASE
+            somme[debordes + 1] += 1
+        if somme[self._longueur]:
+            self._longueur += 1
+
+        self._courant = 1 - self._courant
+        self.index += 1
+
+    def somme_chiffres(self) -> int:
+        """Digit sum of the current term.
+
+        :return (int): sum of the decimal digits of F(index)
+        """
+        return int(SOMMES[self._termes[self._courant, :self._longueur]].sum(dtype=np.int64))
+
+    def valeur(self) -> int:
+        """Value of the current term.
+
+        :return (int): F(index)
+        """
+        def assembler(limbes: list[int]) -> int:
+            """Value of limbs, by halves: int(str) is limited to 4300 digits.
+
+            :param limbes (list[int]): limbs, least significant first
+            :return (int): value of the limbs
+            """
+            if len(limbes) <= 256:
+                return int("".join(f"{limbe:0{CHIFFRES_LIMBE}d}" for limbe in reversed(limbes)))
+            milieu = len(limbes) // 2
+            return assembler(limbes[:milieu]) + assembler(limbes[milieu:]) * BASE ** milieu
+
+        return assembler(self._termes[self._courant, :self._longueur].tolist())
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        """Step through the sequence, from the current term on.
+
+        :return (Iterator[tuple[int, int]]): index and digit sum of each term
+        """
+        while True:
+            yield self.index, self.somme_chiffres()
+            self.avancer()
+
+
+def premier_avec_somme(somme: int, index_max: int | None = None) -> tuple[int, int] | None:
+    """First Fibonacci term with a given digit sum.
+
+    :param somme (int): digit sum looked for
+    :param index_max (int | None): largest index tried, no limit if None
+    :return (tuple[int, int] | None): index and value of the term,
+        None if not found up to index_max
+    """
+    suite = Fibonacci()
+    for index, somme_chiffres in suite:
+        if somme_chiffres == somme:
+            return index, suite.valeur()
+        if index_max is not None and index >= index_max:
+            return None
+
+
+def indices_avec_sommes(sommes: set[int], index_max: int) -> list[int]:
+    """Indices of the Fibonacci terms whose digit sum is in a set.
+
+    :param sommes (set[int]): digit sums looked for
+    :param index_max (int): largest index tried
+    :return (list[int]): indices up to index_max, in increasing order
+    """
+    indices = []
+    for index, somme_chiffres in Fibonacci():
+        if somme_chiffres in sommes:
+            indices.append(index)
+        if index >= index_max:
+            return indices
@@ -0,0 +1,167 @@
+"""Iterated maps x -> f(x) on a finite set of states, fast-forwarded by cycle detection.
+
+The orbit of a starting state under a deterministic map on a finite set
+always ends in a cycle: a tail of mu states, then a cycle of lam states
+repeated forever. Brent's algorithm finds mu and lam once, with O(mu + lam)
+calls to f, and the state after any number of steps, even astronomically
+large, is then read from the states stored.
+
+For many starting values on the integer states 0 .. n - 1, the successor of
+every state is computed once (a functional graph) and shared by all of them.
+NumPy is only imported by these functions, so that Orbite and brent do not
+load it.
+"""
+from collections.abc import Callable, Hashable, Sequence
+from typing import TYPE_CHECKING, Generic, NamedTuple, TypeVar
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+Etat = TypeVar("Etat", bound=Hashable)
+
+
+class Cycle(NamedTuple):
+    """Shape of an orbit: queue states before the cycle, then periode states repeated."""
+    queue: int
+    periode: int
+
+
+def brent(fonction: Callable[[Etat], Etat], depart: Etat) -> Cycle:
+    """Tail and period of the orbit of a state, by Brent's algorithm.
+
+    :param fonction (Callable[[Etat], Etat]): map applied at each step
+    :param depart (Etat): starting state
+    :return (Cycle): length of the tail and of the cycle
+    """
+    # period: the hare runs ahead of a tortoise teleported at each power of 2
+    puissance = periode = 1
+    tortue, lievre = depart, fonction(depart)
+    while tortue != lievre:
+        if puissance == periode:
+            tortue = lievre
+            puissance *= 2
+            periode = 0
+        lievre = fonction(lievre)
+        periode += 1
+
+    # tail: two states periode steps apart meet at the start of the cycle
+    tortue = lievre = depart
+    for _ in range(periode):
+        lievre = fonction(lievre)
+    queue = 0
+    while tortue != lievre:
+        tortue = fonction(tortue)
+        lievre = fonction(lievre)
+        queue += 1
+
+    return Cycle(queue, periode)
+
+
+class Orbite(Generic[Etat]):
+    """Orbit of a state under a map, stored up to the end of its first cycle.
+
+    :param fonction (Callable[[Etat], Etat]): map applied at each step
+    :param depart (Etat): starting state
+    """
+    def __init__(self, fonction: Callable[[Etat], Etat], depart: Etat) -> None:
+        self.cycle = brent(fonction, depart)
+        self.etats = [depart]
+        for _ in range(self.cycle.queue + self.cycle.periode - 1):
+            self.etats.append(fonction(self.etats[-1]))
+
+    def etat(self, etapes: int) -> Etat:
+        """State reached after some steps.
+
+        :param etapes (int): number of steps, as large as needed
+        :return (Etat): state after etapes steps
+        """
+        queue, periode = self.cycle
+        if etapes >= queue:
+            etapes = queue + (etapes - queue) % periode
+
+        return self.etats[etapes]
+
+    def premier(self, predicat: Callable[[Etat], bool]) -> int | None:
+        """First step whose state meets a condition.
+
+        :param predicat (Callable[[Etat], bool]): condition on a state
+        :return (int | None): number of steps to reach the first state meeting
+            predicat (0 if the starting state does), None if no state of the
+            orbit ever does
+        """
+        for etapes, etat in enumerate(self.etats):
+            if predicat(etat):
+                return etapes
+
+        return None
+
+
+def successeurs(fonction: Callable[[int], int], taille: int) -> "NDArray":
+    """Functional graph of a map on the states 0 .. taille - 1.
+
+    :param fonction (Callable[[int], int]): map, from and to 0 .. taille - 1
+    :param taille (int): number of states
+    :return (NDArray): successor of each state
+    """
+    import numpy as np
+
+    return np.fromiter((fonction(etat) for etat in range(taille)), dtype=np.int64, count=taille)
+
+
+def apres_lot(suivants: "NDArray", departs: "Sequence[int] | NDArray",
+              etapes: int) -> "NDArray":
+    """States reached by many starting states after the same number of steps.
+
+    The map is squared at each bit of etapes, on the whole functional graph.
+
+    :param suivants (NDArray): successor of each state
+    :param departs (Sequence[int] | NDArray): starting states
+    :param etapes (int): number of steps, as large as needed
+    :return (NDArray): state reached from each starting state
+    """
+    import numpy as np
+
+    etats = np.array(departs, dtype=np.int64)
+    saut = suivants
+    while etapes:
+        if etapes & 1:
+            etats = saut[etats]
+        etapes >>= 1
+        if etapes:
+            saut = saut[saut]
+
+    return etats
+
+
+def distances_lot(suivants: "NDArray", cibles: "NDArray") -> "NDArray":
+    """Number of steps from every state to the first state meeting a condition.
+
+    Each state is walked once: the paths of different starting states share
+    their distances as soon as they merge.
+
+    :param suivants (NDArray): successor of each state
+    :param cibles (NDArray): boolean array, True for the states meeting the condition
+    :return (NDArray): distance of each state, -1 if its orbit never meets the condition
+    """
+    import numpy as np
+
+    INCONNUE, EN_COURS = -2, -3
+    distances = np.where(cibles, 0, INCONNUE).tolist()
+    suivants_liste = suivants.tolist()
+
+    for depart in range(len(distances)):
+        chemin = []
+        etat = depart
+        while distances[etat] == INCONNUE:
+            distances[etat] = EN_COURS
+            chemin.append(etat)
+            etat = suivants_liste[etat]
+
+        # looping back on the path: a cycle without any target
+        distance = -1 if distances[etat] in (EN_COURS, -1) else distances[etat]
+        for etat in reversed(chemin):
+            if distance >= 0:
+                distance += 1
+            distances[etat] = distance
+
+    return np.array(distances, dtype=np.int64)
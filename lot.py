@@ -0,0 +1,205 @@
+"""Batch execution of the challenge solvers in a pool of processes.
+
+Each solver runs in its own process, so that a slow one can be stopped when
+its time is over without blocking the others. These processes are not
+daemons, so that solvers may start their own pools of processes: each one
+leads its own process group, killed as a whole when its time is over. For
+each solver, the report gives its returned value, what it printed, its wall
+time and CPU time (the modules it imports are loaded before the timer
+starts) and its peak memory (RSS).
+"""
+import contextlib
+import io
+import json
+import multiprocessing
+import multiprocessing.connection
+import os
+import signal
+import time
+import traceback
+from typing import Any
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+OK = "ok"
+ERREUR = "erreur"
+DELAI_DEPASSE = "délai dépassé"
+IGNORE = "ignoré"
+
+
+def _pic_memoire() -> int | None:
+    """Peak resident memory of the current process.
+
+    :return (int | None): peak RSS in bytes, None if unavailable
+    """
+    if resource is None:
+        return None
+    pic = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux gives kilobytes, macOS gives bytes
+    return pic if os.uname().sysname == "Darwin" else pic * 1024
+
+
+def _executer(nom: str, arguments: list[Any], dossier: str | None,
+              connexion: multiprocessing.connection.Connection) -> None:
+    """Run a solver in a child process and send its measures to the parent.
+
+    :param nom (str): name of the solver
+    :param arguments (list[Any]): arguments given to the solver
+    :param dossier (str | None): folder containing the data folders,
+        the repository if None
+    :param connexion (Connection): pipe to the parent process
+    """
+    if hasattr(os, "setsid"):
+        # its own process group, killed with its children when the time is over
+        os.setsid()
+    from registre import DOSSIER, lancer, preparer
+
+    sortie = io.StringIO()
+    mesure = {"statut": OK, "resultat": None, "erreur": None}
+    debut, debut_cpu = time.perf_counter(), time.process_time()
+    try:
+        with contextlib.redirect_stdout(sortie):
+            # the modules are loaded before the timer starts
+            preparer(nom)
+            debut, debut_cpu = time.perf_counter(), time.process_time()
+            resultat = lancer(nom, *arguments, dossier=dossier or DOSSIER)
+        mesure["resultat"] = None if resultat is None else repr(resultat)
+    except BaseException:
+        mesure["statut"] = ERREUR
+        mesure["erreur"] = traceback.format_exc()
+
+    mesure["duree"] = time.perf_counter() - debut
+    mesure["duree_cpu"] = time.process_time() - debut_cpu
+    mesure["memoire_max"] = _pic_memoire()
+    mesure["sortie"] = sortie.getvalue()
+    connexion.send(mesure)
+    connexion.close()
+
+
+def _arreter(process: multiprocessing.Process) -> None:
+    """Kill a solver process and the processes it started.
+
+    :param process (Process): process running _executer
+    """
+    if hasattr(os, "killpg"):
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+            return
+        except ProcessLookupError:
+            # the group ended, or the process has not created it yet
+            pass
+    process.kill()
+
+
+def executer_lot(appels: list[tuple[str, list[Any]]], processus: int | None = None,
+                 delai: float = 300.0, dossier: str | None = None) -> list[dict[str, Any]]:
+    """Run solvers in parallel, each one in its own process.
+
+    :param appels (list[tuple[str, list[Any]]]): names of the solvers
+        with their arguments
+    :param processus (int | None): maximum number of simultaneous processes,
+        number of CPUs if None
+    :param delai (float): time in seconds after which a solver is stopped
+    :param dossier (str | None): folder containing the data folders,
+        the repository if None
+    :return (list[dict[str, Any]]): one report per solver, in the order of appels
+    """
+    processus = processus or os.cpu_count() or 1
+    a_lancer = list(enumerate(appels))
+    a_lancer.reverse()
+    en_cours = {}
+    rapports: list[dict[str, Any]] = [{} for _ in appels]
+
+    while a_lancer or en_cours:
+        while a_lancer and len(en_cours) < processus:
+            idx, (nom, arguments) = a_lancer.pop()
+            reception, envoi = multiprocessing.Pipe(duplex=False)
+            process = multiprocessing.Process(
+                target=_executer, args=(nom, arguments, dossier, envoi))
+            process.start()
+            envoi.close()
+            en_cours[reception] = (idx, nom, process, time.perf_counter())
+
+        echeance = min(debut for _, _, _, debut in en_cours.values()) + delai
+        prets = multiprocessing.connection.wait(
+            list(en_cours), timeout=max(0.0, echeance - time.perf_counter()))
+
+        for reception in prets:
+            idx, nom, process, _ = en_cours.pop(reception)
+            try:
+                rapport = reception.recv()
+            except EOFError:
+                # the process died without sending anything
+                rapport = {"statut": ERREUR, "erreur": "processus interrompu"}
+            reception.close()
+            process.join()
+            rapports[idx] = {"nom": nom, **rapport}
+
+        maintenant = time.perf_counter()
+        for reception, (idx, nom, process, debut) in list(en_cours.items()):
+            if maintenant - debut >= delai:
+                _arreter(process)
+                process.join()
+                reception.close()
+                del en_cours[reception]
+                rapports[idx] = {"nom": nom, "statut": DELAI_DEPASSE, "duree": delai}
+
+    return rapports
+
+
+def rapport_markdown(rapports: list[dict[str, Any]]) -> str:
+    """Format the reports as a Markdown table.
+
+    :param rapports (list[dict[str, Any]]): reports returned by executer_lot
+    :return (str): Markdown document
+    """
+    def nombre(valeur: float | None, format: str) -> str:
+        """Format an optional number.
+
+        :param valeur (float | None): number to format
+        :param format (str): format specification
+        :return (str): formatted number, empty if valeur is None
+        """
+        return "" if valeur is None else f"{valeur:{format}}"
+
+    lignes = [
+        "| Défi | Statut | Durée (s) | CPU (s) | Mémoire max (Mo) | Résultat |",
+        "|---|---|---:|---:|---:|---|",
+    ]
+    for rapport in rapports:
+        memoire = rapport.get("memoire_max")
+        resultat = rapport.get("resultat") or ""
+        if not resultat and rapport.get("sortie"):
+            # solvers printing their result: keep the last line printed
+            resultat = rapport["sortie"].strip().splitlines()[-1]
+        resultat = resultat.replace("|", "\\|")
+        if len(resultat) > 80:
+            resultat = resultat[:77] + "..."
+        lignes.append(
+            f"| {rapport['nom']} | {rapport['statut']} "
+            f"| {nombre(rapport.get('duree'), '.3f')} "
+            f"| {nombre(rapport.get('duree_cpu'), '.3f')} "
+            f"| {nombre(memoire and memoire / 2**20, '.1f')} "
+            f"| {resultat} |"
+        )
+
+    return "\n".join(lignes) + "\n"
+
+
+def ecrire_rapports(rapports: list[dict[str, Any]], fichier_json: str | None,
+                    fichier_markdown: str | None) -> None:
+    """Write the reports to disk.
+
+    :param rapports (list[dict[str, Any]]): reports returned by executer_lot
+    :param fichier_json (str | None): path of the JSON report, not written if None
+    :param fichier_markdown (str | None): path of the Markdown report, not written if None
+    """
+    if fichier_json:
+        with open(fichier_json, mode="w", encoding="utf-8") as f:
+            json.dump(rapports, f, ensure_ascii=False, indent=2)
+    if fichier_markdown:
+        with open(fichier_markdown, mode="w", encoding="utf-8") as f:
+            f.write(rapport_markdown(rapports))
@@ -0,0 +1,166 @@
+"""Reverse-and-add chains: x -> x + reverse(x), until a palindrome is reached.
+
+Chains of different seeds often merge, and x and reverse(x) have the same
+next value (when x does not end with 0), so the palindrome reached from each
+value of a chain is memoized, under the smaller of x and reverse(x), and
+shared by all the seeds.
+Some numbers, like 196, never seem to reach a palindrome: the number of
+iterations is capped. Long numbers are stepped as NumPy digit arrays.
+"""
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from numpy.typing import NDArray
+
+ITERATIONS_MAX = 1000
+# above this number of digits, numbers are stepped as digit arrays
+SEUIL_CHIFFRES = 200
+TAILLE_BLOC = 100_000
+
+
+def _chiffres(nombre: int) -> NDArray:
+    """Digits of a number.
+
+    :param nombre (int): number, positive
+    :return (NDArray): decimal digits, least significant first
+    """
+    return np.frombuffer(str(nombre)[::-1].encode("ascii"), dtype=np.uint8) - ord("0")
+
+
+def _entier(chiffres: NDArray) -> int:
+    """Number from its digits, by halves: int(str) is limited to 4300 digits.
+
+    :param chiffres (NDArray): decimal digits, least significant first
+    :return (int): the number
+    """
+    if len(chiffres) <= 1000:
+        return int((chiffres[::-1] + ord("0")).astype(np.uint8).tobytes())
+    milieu = len(chiffres) // 2
+    return _entier(chiffres[:milieu]) + _entier(chiffres[milieu:]) * 10 ** milieu
+
+
+def _etape_chiffres(chiffres: NDArray) -> NDArray:
+    """One reverse-and-add step on digits.
+
+    :param chiffres (NDArray): decimal digits, least significant first
+    :return (NDArray): digits of the number plus its reverse
+    """
+    somme = np.zeros(len(chiffres) + 1, dtype=np.uint8)
+    somme[:-1] = chiffres + chiffres[::-1]
+    # each digit is at most 9 + 9 + 1, so the carries are 0 or 1
+    while True:
+        debordes = np.flatnonzero(somme >= 10)
+        if not debordes.size:
+            break
+        somme[debordes] -= 10
+        somme[debordes + 1] += 1
+
+    return somme if somme[-1] else somme[:-1]
+
+
+class Miroir:
+    """Reverse-and-add engine, with a memo shared by all the seeds.
+
+    :param iterations_max (int): largest number of steps before giving up on a seed
+    """
+    def __init__(self, iterations_max: int = ITERATIONS_MAX) -> None:
+        self.iterations_max = iterations_max
+        # min(x, reverse(x)) -> first palindrome reached from x and number of steps
+        self._memo: dict[int, tuple[int, int]] = {}
+        # min(x, reverse(x)) -> number of steps made from x without reaching a palindrome
+        self._echecs: dict[int, int] = {}
+
+    def palindrome(self, nombre: int) -> tuple[int, int] | None:
+        """First palindrome of the chain of a number, after at least one step.
+
+        :param nombre (int): seed, positive
+        :return (tuple[int, int] | None): palindrome and number of steps,
+            None if not reached within iterations_max steps
+        """
+        chemin: list[int] = []
+        valeur = nombre
+        resultat = None
+        while len(chemin) < self.iterations_max:
+            if len(str(valeur)) > SEUIL_CHIFFRES:
+                resultat = self._palindrome_chiffres(valeur, self.iterations_max - len(chemin))
+                break
+            miroir = int(str(valeur)[::-1])
+            # x and reverse(x) have the same next value, unless x ends with 0
+            cle = min(valeur, miroir) if valeur % 10 else valeur
+            if cle in self._memo:
+                resultat = self._memo[cle]
+                break
+            if self._echecs.get(cle, 0) >= self.iterations_max - len(chemin):
+                break
+
+            chemin.append(cle)
+            valeur += miroir
+            texte = str(valeur)
+            if texte == texte[::-1]:
+                resultat = (valeur, 0)
+                break
+
+        if resultat is None:
+            for idx, cle in enumerate(chemin):
+                self._echecs[cle] = max(self._echecs.get(cle, 0), self.iterations_max - idx)
+            return None
+
+        # every value of the path reaches the same palindrome
+        palindrome, etapes = resultat
+        for cle in reversed(chemin):
+            etapes += 1
+            self._memo[cle] = (palindrome, etapes)
+
+        etapes = resultat[1] + len(chemin)
+        if etapes > self.iterations_max:
+            return None
+
+        return palindrome, etapes
+
+    def _palindrome_chiffres(self, nombre: int, iterations: int) -> tuple[int, int] | None:
+        """Chain of a long number, as digit arrays, without memo.
+
+        :param nombre (int): long number, before its first step
+        :param iterations (int): largest number of steps
+        :return (tuple[int, int] | None): palindrome and number of steps,
+            None if not reached within iterations steps
+        """
+        chiffres = _chiffres(nombre)
+        for etapes in range(1, iterations + 1):
+            chiffres = _etape_chiffres(chiffres)
+            if np.array_equal(chiffres, chiffres[::-1]):
+                return _entier(chiffres), etapes
+
+        return None
+
+
+def _palindromes_bloc(graines: Sequence[int], iterations_max: int) -> list[tuple[int, int] | None]:
+    """Palindromes of a block of seeds, with the memo of the process.
+
+    :param graines (Sequence[int]): seeds
+    :param iterations_max (int): largest number of steps for each seed
+    :return (list[tuple[int, int] | None]): result of each seed, see Miroir.palindrome
+    """
+    miroir = Miroir(iterations_max)
+    return [miroir.palindrome(graine) for graine in graines]
+
+
+def palindromes_lot(graines: Sequence[int], iterations_max: int = ITERATIONS_MAX,
+                    processus: int | None = None,
+                    taille_bloc: int = TAILLE_BLOC) -> list[tuple[int, int] | None]:
+    """Palindromes of many seeds, by blocks in several processes.
+
+    Each block shares a memo, so consecutive seeds, whose chains often
+    merge, are better kept in the same block.
+
+    :param graines (Sequence[int]): seeds
+    :param iterations_max (int): largest number of steps for each seed
+    :param processus (int | None): number of processes, number of CPUs if None
+    :param taille_bloc (int): number of seeds of each block
+    :return (list[tuple[int, int] | None]): result of each seed, in the order of graines
+    """
+    blocs = [graines[debut:debut + taille_bloc] for debut in range(0, len(graines), taille_bloc)]
+    with ProcessPoolExecutor(max_workers=processus) as executeur:
+        resultats = executeur.map(_palindromes_bloc, blocs, [iterations_max] * len(blocs))
+        return [resultat for bloc in resultats for resultat in bloc]
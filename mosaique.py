@@ -0,0 +1,161 @@
+"""Mosaics assembled from numbered tiles placed on a grid.
+
+The tiles are decoded by a pool of threads (PIL releases the GIL while
+decoding), a few placements ahead of the one being pasted, so that only a
+bounded number of decoded tiles are held in memory. A tile used again within
+these placements is decoded once; once pasted, the most recently used tiles
+are kept in a cache of bounded size, and a tile evicted from it is decoded
+again when needed. When several tiles are placed in the same slot, only the
+last one in sorted order is kept.
+
+The canvas is a NumPy array. When it would be larger than the memory
+allowed, it is a memory map of the output file itself, in the binary PPM
+format (a short header, then the raw RGB rows), so mosaics much larger than
+the RAM are written straight to disk.
+"""
+from collections import Counter, OrderedDict
+from collections.abc import Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+import os
+from typing import NamedTuple
+
+import numpy as np
+from numpy.typing import NDArray
+from PIL import Image
+
+TAILLE_CASE = 32
+# canvas larger than this number of bytes: memory map of a PPM file
+MEMOIRE_MAX = 1 << 30
+# decoded tiles kept after being pasted, for the next slots using them
+TUILES_EN_CACHE = 64
+
+
+class Placement(NamedTuple):
+    """Tile image placed in the slot (x, y) of the grid."""
+    x: int
+    y: int
+    image: int
+
+
+def lire_placements(fichier: str) -> list[Placement]:
+    """Read the placements of the tiles, one "x, y, image" per line.
+
+    :param fichier (str): path of the file
+    :return (list[Placement]): placements, sorted by x, y and image
+    """
+    placements = []
+    with open(fichier, mode="r", encoding="utf-8") as f:
+        for ligne in f:
+            if ligne.strip():
+                x, y, image = ligne.strip().split(", ")
+                placements.append(Placement(int(x), int(y), int(image)))
+
+    return sorted(placements)
+
+
+def _decoder(fichier: str) -> NDArray:
+    """Decode a tile.
+
+    :param fichier (str): path of the tile image
+    :return (NDArray): RGB pixels, shape (height, width, 3)
+    """
+    with Image.open(fichier) as image:
+        return np.asarray(image.convert("RGB"))
+
+
+def _toile(destination: str, largeur: int, hauteur: int, memoire_max: int) -> NDArray:
+    """Blank canvas, in memory or mapped on a PPM file.
+
+    :param destination (str): path of the output image
+    :param largeur (int): width of the canvas
+    :param hauteur (int): height of the canvas
+    :param memoire_max (int): largest canvas kept in memory, in bytes
+    :return (NDArray): black canvas, shape (hauteur, largeur, 3); a numpy.memmap
+        of destination if it is a PPM file or the canvas is too large
+    """
+    taille = largeur * hauteur * 3
+    if not destination.lower().endswith(".ppm") and taille <= memoire_max:
+        return np.zeros((hauteur, largeur, 3), dtype=np.uint8)
+
+    entete = f"P6\n{largeur} {hauteur}\n255\n".encode("ascii")
+    with open(destination, mode="wb") as f:
+        f.write(entete)
+        # a sparse file full of zeros, that is black pixels
+        f.truncate(len(entete) + taille)
+
+    return np.memmap(destination, dtype=np.uint8, mode="r+", offset=len(entete),
+                     shape=(hauteur, largeur, 3))
+
+
+def assembler(placements: Sequence[Placement], modele: str, destination: str,
+              taille: tuple[int, int] | None = None, case: int = TAILLE_CASE,
+              processus: int | None = None, memoire_max: int = MEMOIRE_MAX,
+              tuiles_en_cache: int = TUILES_EN_CACHE) -> str:
+    """Assemble a mosaic and save it.
+
+    :param placements (Sequence[Placement]): tiles to paste, in order
+    :param modele (str): path of the tiles, formatted with the image number,
+        like "./tuiles/{:03d}.jpeg"
+    :param destination (str): path of the mosaic; written as a PPM file,
+        whatever its extension, if the canvas is larger than memoire_max
+    :param taille (tuple[int, int] | None): width and height of the mosaic,
+        just large enough for the slots if None
+    :param case (int): side of a slot of the grid, in pixels
+    :param processus (int | None): number of decoding threads, number of CPUs if None
+    :param memoire_max (int): largest canvas kept in memory, in bytes
+    :param tuiles_en_cache (int): decoded tiles kept after being pasted
+    :return (str): path of the mosaic written
+    """
+    # the last tile of a slot covers the previous ones
+    derniers = {(p.x, p.y): idx for idx, p in enumerate(placements)}
+    placements = [placements[idx] for idx in sorted(derniers.values())]
+
+    if taille is None:
+        taille = (max((p.x + 1 for p in placements), default=0) * case,
+                  max((p.y + 1 for p in placements), default=0) * case)
+    largeur, hauteur = taille
+    if largeur * hauteur * 3 > memoire_max and not destination.lower().endswith(".ppm"):
+        destination = os.path.splitext(destination)[0] + ".ppm"
+
+    toile = _toile(destination, largeur, hauteur, memoire_max)
+
+    nb_threads = processus or os.cpu_count() or 1
+    avance = 2 * nb_threads
+    with ThreadPoolExecutor(max_workers=nb_threads) as executeur:
+        # tiles of the next placements, with the number of them using each tile
+        decodages: dict[int, Future[NDArray]] = {}
+        utilisations: Counter[int] = Counter()
+        # tiles already pasted, least recently used first
+        recentes: OrderedDict[int, Future[NDArray]] = OrderedDict()
+        suivant = 0
+        for idx, placement in enumerate(placements):
+            # decoding started for the next placements, not for all of them
+            while suivant < len(placements) and suivant <= idx + avance:
+                image = placements[suivant].image
+                if image not in decodages:
+                    decodages[image] = (recentes.pop(image, None)
+                                        or executeur.submit(_decoder, modele.format(image)))
+                utilisations[image] += 1
+                suivant += 1
+
+            tuile = decodages[placement.image].result()
+            utilisations[placement.image] -= 1
+            if not utilisations[placement.image]:
+                del utilisations[placement.image]
+                recentes[placement.image] = decodages.pop(placement.image)
+                if len(recentes) > tuiles_en_cache:
+                    recentes.popitem(last=False)
+
+            x, y = placement.x * case, placement.y * case
+            if x < largeur and y < hauteur:
+                hauteur_tuile = min(tuile.shape[0], hauteur - y)
+                largeur_tuile = min(tuile.shape[1], largeur - x)
+                toile[y:y + hauteur_tuile, x:x + largeur_tuile] = \
+                    tuile[:hauteur_tuile, :largeur_tuile]
+
+    if isinstance(toile, np.memmap):
+        toile.flush()
+    else:
+        Image.fromarray(toile).save(destination)
+
+    return destination
@@ -0,0 +1,263 @@
+"""Word lists compiled to a binary cache and read through a memory map,
+and tools shared by the challenges working on words.
+
+The first time a word list is used, it is compiled to a binary file:
+
+    header   "PYDMOTS1", number of words n (uint64)
+    offsets  n + 1 uint64, start of each word in the blob
+    blob     words encoded in UTF-8, each one followed by "\\n"
+
+The cache file is named after the SHA-256 hash of the source, so it is
+rebuilt whenever the source changes. The hash is saved with the size and the
+modification time of the source, and only computed again when they change.
+Later runs only map the cache file in memory: nothing is parsed, and a word
+is decoded when it is accessed. The cache files are written in .cache/mots,
+or in the mots folder of the folder named by the PYDEFIS_CACHE environment
+variable.
+"""
+from collections.abc import Iterable, Iterator, Sequence
+import hashlib
+import json
+import mmap
+import os
+import struct
+import time
+from typing import overload
+import unicodedata
+from zipfile import ZipFile
+
+RACINE_CACHE = os.environ.get("PYDEFIS_CACHE",
+                              os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache"))
+DOSSIER_CACHE = os.path.join(RACINE_CACHE, "mots")
+DOSSIER_ANAGRAMMES = os.path.join(RACINE_CACHE, "anagrammes")
+MAGIQUE = b"PYDMOTS1"
+ENTETE = struct.Struct("<8sQ")
+
+
+def _empreinte(source: str, membre: str | None, dossier_cache: str) -> str:
+    """Hash of a word list source, computed again only when the source changes.
+
+    The hash is saved in dossier_cache with the size and the modification
+    time of the source, and reused while they are the same: loading a list
+    does not read its whole source.
+
+    :param source (str): path of the text file, or of the zip archive
+    :param membre (str | None): name of the text file in the zip archive
+    :param dossier_cache (str): folder of the saved hashes
+    :return (str): hexadecimal SHA-256 of the source content
+    """
+    etat = os.stat(source)
+    cle = hashlib.sha256(f"{os.path.abspath(source)}\n{membre}".encode("utf-8")).hexdigest()
+    fichier = os.path.join(dossier_cache, f"{cle}.empreinte")
+    try:
+        with open(fichier, mode="r", encoding="utf-8") as f:
+            sauvegarde = json.load(f)
+        if sauvegarde["taille"] == etat.st_size and sauvegarde["mtime"] == etat.st_mtime_ns:
+            return sauvegarde["empreinte"]
+    except (FileNotFoundError, json.JSONDecodeError, KeyError):
+        pass
+
+    empreinte = hashlib.sha256()
+    with open(source, mode="rb") as f:
+        while bloc := f.read(1 << 20):
+            empreinte.update(bloc)
+    if membre is not None:
+        empreinte.update(membre.encode("utf-8"))
+
+    # a source modified within the last seconds may change again with the
+    # same modification time: its hash is not saved
+    if time.time() - etat.st_mtime_ns / 1e9 > 2:
+        os.makedirs(dossier_cache, exist_ok=True)
+        temporaire = f"{fichier}.{os.getpid()}.tmp"
+        with open(temporaire, mode="w", encoding="utf-8") as f:
+            json.dump({"source": os.path.abspath(source), "taille": etat.st_size,
+                       "mtime": etat.st_mtime_ns, "empreinte": empreinte.hexdigest()}, f)
+        os.replace(temporaire, fichier)
+
+    return empreinte.hexdigest()
+
+
+def _lire_source(source: str, membre: str | None) -> list[str]:
+    """Read the words of a source, one per line.
+
+    :param source (str): path of the text file, or of the zip archive
+    :param membre (str | None): name of the text file in the zip archive
+    :return (list[str]): words, without line endings
+    """
+    if membre is None:
+        with open(source, mode="r", encoding="utf-8") as f:
+            texte = f.read()
+    else:
+        with ZipFile(source, "r") as zip_file:
+            texte = zip_file.read(membre).decode("utf-8").replace("\r\n", "\n")
+
+    mots = texte.split("\n")
+    # the last line may end with a newline
+    if mots[-1] == "":
+        mots.pop()
+
+    return mots
+
+
+def compiler(source: str, destination: str, membre: str | None = None) -> None:
+    """Compile a word list to the binary format.
+
+    :param source (str): path of the text file, or of the zip archive
+    :param destination (str): path of the binary file
+    :param membre (str | None): name of the text file in the zip archive
+    """
+    mots = [mot.encode("utf-8") for mot in _lire_source(source, membre)]
+    offsets = [0] * (len(mots) + 1)
+    for idx, mot in enumerate(mots):
+        offsets[idx + 1] = offsets[idx] + len(mot) + 1
+
+    os.makedirs(os.path.dirname(destination), exist_ok=True)
+    temporaire = f"{destination}.{os.getpid()}.tmp"
+    with open(temporaire, mode="wb") as f:
+        f.write(ENTETE.pack(MAGIQUE, len(mots)))
+        f.write(struct.pack(f"<{len(offsets)}Q", *offsets))
+        f.write(b"\n".join(mots))
+        if mots:
+            f.write(b"\n")
+    # several processes may compile the same list at once
+    os.replace(temporaire, destination)
+
+
+class ListeMots(Sequence[str]):
+    """Read-only list of the words of a file, one word per line.
+
+    :param source (str): path of the text file, or of the zip archive
+    :param membre (str | None): name of the text file in the zip archive
+    :param dossier_cache (str): folder of the compiled files
+    """
+    def __init__(self, source: str, membre: str | None = None,
+                 dossier_cache: str = DOSSIER_CACHE) -> None:
+        self.source = source
+        self.membre = membre
+        self.fichier = os.path.join(dossier_cache,
+                                    f"{_empreinte(source, membre, dossier_cache)}.bin")
+        if not os.path.exists(self.fichier):
+            compiler(source, self.fichier, membre)
+
+        with open(self.fichier, mode="rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magique, self._nombre = ENTETE.unpack_from(self._mmap)
+        if magique != MAGIQUE:
+            raise ValueError(f"{self.fichier} n'est pas une liste de mots compilée.")
+
+        debut_blob = ENTETE.size + 8 * (self._nombre + 1)
+        self._offsets = memoryview(self._mmap)[ENTETE.size:debut_blob].cast("Q")
+        self.blob = memoryview(self._mmap)[debut_blob:]
+
+    def __len__(self) -> int:
+        return self._nombre
+
+    @overload
+    def __getitem__(self, idx: int) -> str: ...
+
+    @overload
+    def __getitem__(self, idx: slice) -> list[str]: ...
+
+    def __getitem__(self, idx: int | slice) -> str | list[str]:
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(self._nombre))]
+        if idx < 0:
+            idx += self._nombre
+        if not 0 <= idx < self._nombre:
+            raise IndexError("indice de mot hors limites")
+
+        return str(self.blob[self._offsets[idx]:self._offsets[idx + 1] - 1], "utf-8")
+
+    def __iter__(self) -> Iterator[str]:
+        # decoding the whole blob at once is much faster than word by word
+        texte = str(self.blob, "utf-8")
+        debut = 0
+        for _ in range(self._nombre):
+            fin = texte.index("\n", debut)
+            yield texte[debut:fin]
+            debut = fin + 1
+
+    def fermer(self) -> None:
+        """Release the memory map."""
+        self._offsets.release()
+        self.blob.release()
+        self._mmap.close()
+
+    def __enter__(self) -> "ListeMots":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.fermer()
+
+
+def remove_accents(input_str: str) -> str:
+    """Normalized the chain using the form NFD
+    (normalization form decomposition) which breaks down
+    the characterized characters into basic characters + accents
+
+    :param input_str (str): string to process
+    :return (str): processed string
+    """
+    normalized_str = unicodedata.normalize('NFD', input_str)
+    # remove all characters of category "Mn" (Mark, Nonspacing), which are accents,
+    # using comprehension list
+    return ''.join(
+        char for char in normalized_str
+        if unicodedata.category(char) != 'Mn'
+    )
+
+
+def signature_anagramme(nom: str) -> str:
+    """Letters of a name, whatever their order, accents, case and spaces.
+
+    :param nom (str): name to process
+    :return (str): letters of nom without accents, in lower case, sorted;
+        two names are anagrams if they have the same signature
+    """
+    return "".join(sorted(remove_accents(nom).replace(" ", "").lower()))
+
+
+class IndexAnagrammes:
+    """Names of a file indexed by their anagram signature.
+
+    The index is built once per file and saved next to the compiled word lists,
+    named after the hash of the file.
+
+    :param source (str): path of the file, one name per line
+    :param dossier_cache (str): folder of the saved indexes
+    """
+    def __init__(self, source: str, dossier_cache: str = DOSSIER_ANAGRAMMES) -> None:
+        self.source = source
+        self.fichier = os.path.join(dossier_cache,
+                                    f"{_empreinte(source, None, dossier_cache)}.json")
+
+        if os.path.exists(self.fichier):
+            with open(self.fichier, mode="r", encoding="utf-8") as f:
+                self.index: dict[str, list[str]] = json.load(f)
+            return
+
+        self.index = {}
+        for nom in ListeMots(source):
+            self.index.setdefault(signature_anagramme(nom), []).append(nom)
+
+        os.makedirs(dossier_cache, exist_ok=True)
+        temporaire = f"{self.fichier}.{os.getpid()}.tmp"
+        with open(temporaire, mode="w", encoding="utf-8") as f:
+            json.dump(self.index, f, ensure_ascii=False)
+        os.replace(temporaire, self.fichier)
+
+    def chercher(self, nom: str) -> list[str]:
+        """Names of the file that are anagrams of nom.
+
+        :param nom (str): name to look for
+        :return (list[str]): every matching name, in file order
+        """
+        return self.index.get(signature_anagramme(nom), [])
+
+    def chercher_tous(self, noms: Iterable[str]) -> dict[str, list[str]]:
+        """Anagrams of several names.
+
+        :param noms (Iterable[str]): names to look for
+        :return (dict[str, list[str]]): matching names of the file, for each name
+        """
+        return {nom: self.chercher(nom) for nom in noms}
@@ -0,0 +1,113 @@
+"""Multiplicative persistence: number of times the digits of a number must be
+multiplied together before reaching a single digit (39 -> 27 -> 14 -> 4: 3).
+
+The persistence of a number only depends on its digits, not on their order,
+so it is memoized on the sorted digits. Over a range, the numbers are not
+enumerated: a digit DP counts how many numbers below a bound have each digit
+product, and all the numbers sharing a product share their persistence.
+"""
+from collections import Counter
+from functools import cache
+
+
+@cache
+def _persistance_chiffres(chiffres: str) -> int:
+    """Persistence of a number given by its sorted digits.
+
+    :param chiffres (str): digits of the number, sorted
+    :return (int): persistence of the number
+    """
+    if len(chiffres) == 1:
+        return 0
+    produit = 1
+    for chiffre in chiffres:
+        produit *= int(chiffre)
+
+    return 1 + persistance(produit)
+
+
+def persistance(nombre: int) -> int:
+    """Multiplicative persistence of a number.
+
+    :param nombre (int): number to analyze, positive
+    :return (int): persistence of the number, 0 for a single digit
+    """
+    return _persistance_chiffres("".join(sorted(str(nombre))))
+
+
+@cache
+def _produits_libres(nb_chiffres: int) -> dict[int, int]:
+    """Digit products of all the sequences of nb_chiffres digits from 0 to 9.
+
+    :param nb_chiffres (int): number of digits
+    :return (dict[int, int]): number of sequences having each product
+    """
+    if nb_chiffres == 0:
+        return {1: 1}
+    produits: Counter[int] = Counter()
+    for produit, nombre in _produits_libres(nb_chiffres - 1).items():
+        for chiffre in range(10):
+            produits[produit * chiffre] += nombre
+
+    return dict(produits)
+
+
+def produits(borne: int) -> Counter[int]:
+    """Digit products of the numbers with at least two digits, up to a bound.
+
+    :param borne (int): largest number counted
+    :return (Counter[int]): number of integers from 10 to borne having each digit product
+    """
+    resultat: Counter[int] = Counter()
+    if borne < 10:
+        return resultat
+
+    chiffres = [int(chiffre) for chiffre in str(borne)]
+    # numbers with fewer digits than borne: first digit 1 to 9, then free digits
+    for longueur in range(2, len(chiffres)):
+        for produit, nombre in _produits_libres(longueur - 1).items():
+            for premier in range(1, 10):
+                resultat[premier * produit] += nombre
+
+    # numbers with as many digits as borne: same first digits as borne,
+    # then a smaller digit, then free digits
+    prefixe = 1
+    for position, chiffre_borne in enumerate(chiffres):
+        libres = _produits_libres(len(chiffres) - position - 1)
+        for chiffre in range(1 if position == 0 else 0, chiffre_borne):
+            for produit, nombre in libres.items():
+                resultat[prefixe * chiffre * produit] += nombre
+        prefixe *= chiffre_borne
+    # borne itself
+    resultat[prefixe] += 1
+
+    return resultat
+
+
+def histogramme(nombre_1: int, nombre_2: int, maximum: int = 9) -> list[int]:
+    """Number of integers having each persistence, in a range.
+
+    :param nombre_1 (int): lower bound of the range
+    :param nombre_2 (int): upper bound of the range
+    :param maximum (int): largest persistence in the histogram, extended if
+        a number of the range has a larger one
+    :return (list[int]): count of the numbers of persistence 1, 2, ..., maximum;
+        single digits, of persistence 0, are not counted; all zeros if the
+        range is empty (nombre_1 > nombre_2)
+    """
+    if nombre_1 > nombre_2:
+        return [0] * maximum
+
+    comptes = produits(nombre_2)
+    comptes.subtract(produits(nombre_1 - 1))
+
+    resultat = [0] * maximum
+    for produit, nombre in comptes.items():
+        if not nombre:
+            continue
+        valeur = 1 + persistance(produit)
+        if valeur > len(resultat):
+            resultat.extend([0] * (valeur - len(resultat)))
+        resultat[valeur - 1] += nombre
+
+    return resultat
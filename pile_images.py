@@ -0,0 +1,90 @@
+"""Differences between images of the same scene, stacked in one NumPy array.
+
+Instead of comparing every image with every other one (k² comparisons),
+the most frequent value of each pixel over the stack (its mode) is computed
+once, by sorting the stack along its first axis and measuring the runs of
+equal values: each image then differs from the mode on its own pixels. The
+masks are boolean arrays, written as black and white PNG images.
+"""
+from collections.abc import Sequence
+import os
+
+import numpy as np
+from numpy.typing import NDArray
+from PIL import Image
+
+
+def charger_pile(fichiers: Sequence[str], canal: int | None = 0) -> NDArray:
+    """Load images of the same size in a single array.
+
+    :param fichiers (Sequence[str]): paths of the images
+    :param canal (int | None): channel kept, all the channels if None
+    :return (NDArray): pixels, shape (images, height, width), plus channels if canal is None
+    """
+    images = []
+    for fichier in fichiers:
+        with Image.open(fichier) as image:
+            pixels = np.asarray(image)
+        if canal is not None and pixels.ndim == 3:
+            pixels = pixels[:, :, canal]
+        images.append(pixels)
+
+    if len({pixels.shape for pixels in images}) > 1:
+        raise ValueError("les images n'ont pas toutes les mêmes dimensions.")
+
+    return np.stack(images)
+
+
+def mode(pile: NDArray) -> NDArray:
+    """Most frequent value of each pixel over the images, the smallest on ties.
+
+    :param pile (NDArray): pixels, images along the first axis
+    :return (NDArray): mode of each pixel, shape of one image
+    """
+    triee = np.sort(pile, axis=0)
+    rangs = np.arange(len(pile)).reshape((-1,) + (1,) * (pile.ndim - 1))
+    # start of the run of equal values each sorted value belongs to
+    nouvelles = np.ones(triee.shape, dtype=bool)
+    nouvelles[1:] = triee[1:] != triee[:-1]
+    debuts = np.maximum.accumulate(np.where(nouvelles, rangs, 0), axis=0)
+    # the first sorted value reaching the longest run
+    plus_longue = np.argmax(rangs - debuts, axis=0)
+
+    return np.take_along_axis(triee, plus_longue[np.newaxis], axis=0)[0]
+
+
+def masques_differences(pile: NDArray) -> NDArray:
+    """Pixels where each image differs from the mode of the stack.
+
+    :param pile (NDArray): pixels, shape (images, height, width), or with channels
+    :return (NDArray): boolean masks, shape (images, height, width); with channels,
+        a pixel differs if any of its channels does
+    """
+    masques = pile != mode(pile)
+    if masques.ndim == 4:
+        masques = masques.any(axis=3)
+
+    return masques
+
+
+def variations(pile: NDArray) -> NDArray:
+    """Pixels that are not the same in all the images.
+
+    :param pile (NDArray): pixels, shape (images, height, width), or with channels
+    :return (NDArray): boolean mask, shape (height, width)
+    """
+    masque = pile.min(axis=0) != pile.max(axis=0)
+    if masque.ndim == 3:
+        masque = masque.any(axis=2)
+
+    return masque
+
+
+def enregistrer_masque(masque: NDArray, fichier: str) -> None:
+    """Write a mask as a black and white PNG image.
+
+    :param masque (NDArray): boolean mask, shape (height, width), white where True
+    :param fichier (str): path of the PNG image
+    """
+    os.makedirs(os.path.dirname(fichier) or ".", exist_ok=True)
+    Image.fromarray(masque).save(fichier)
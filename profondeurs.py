@@ -0,0 +1,102 @@
+"""Depth maps smoothed by a moving average, and the point of smallest mean depth of each map.
+
+All the maps of a file are loaded in a single NumPy array (maps x rows x
+columns). The mean over a square window around every point is computed with
+a summed-area table: after two cumulative sums, the sum over any window is
+4 lookups, whatever the size of the window, for all the maps at once. Only
+the windows fully inside a map are kept.
+"""
+import re
+
+import numpy as np
+from numpy.typing import NDArray
+
+
+def charger_cartes(fichier: str) -> NDArray:
+    """Read depth maps from a text file.
+
+    The maps are separated by empty lines, each line of a map holds the
+    depths of a row, separated by spaces, tabs, commas or semicolons.
+
+    :param fichier (str): path of the file
+    :return (NDArray): depths, shape (maps, rows, columns)
+    """
+    with open(fichier, mode="r", encoding="utf-8") as f:
+        texte = f.read()
+
+    cartes = []
+    for bloc in re.split(r"\n\s*\n", texte.strip()):
+        lignes = [re.split(r"[\s,;]+", ligne.strip()) for ligne in bloc.splitlines()]
+        cartes.append(np.array(lignes, dtype=np.float64))
+
+    if len({carte.shape for carte in cartes}) > 1:
+        raise ValueError(f"les cartes de {fichier} n'ont pas toutes les mêmes dimensions.")
+
+    return np.stack(cartes)
+
+
+def arrondir(valeurs: NDArray, decimales: int) -> NDArray:
+    """Round values like the built-in round(), from their exact binary value.
+
+    np.round scales the values first, so a value just below a tie, like 0.35
+    (0.34999...), may be rounded up; Python's round() rounds it down.
+
+    :param valeurs (NDArray): values to round
+    :param decimales (int): number of decimals
+    :return (NDArray): rounded values
+    """
+    arrondis = np.round(valeurs, decimales)
+    # only values close to a tie may be rounded differently
+    echelle = np.abs(valeurs * 10.0 ** decimales)
+    proches = np.abs(echelle - np.floor(echelle) - 0.5) < 1e-6
+    arrondis[proches] = [round(valeur, decimales) for valeur in valeurs[proches].tolist()]
+
+    return arrondis
+
+
+def moyennes(cartes: NDArray, fenetre: int = 3, decimales: int | None = None) -> NDArray:
+    """Mean depth over every square window fully inside the maps.
+
+    :param cartes (NDArray): depths, shape (maps, rows, columns)
+    :param fenetre (int): side of the window
+    :param decimales (int | None): number of decimals of the means, rounded like
+        round(), no rounding if None
+    :return (NDArray): means, shape (maps, rows - fenetre + 1, columns - fenetre + 1);
+        element [c, i, j] is the mean of the window whose top left corner is [c, i, j]
+    """
+    nb_cartes, hauteur, largeur = cartes.shape
+    if not 1 <= fenetre <= min(hauteur, largeur):
+        raise ValueError(f"la fenêtre doit être comprise entre 1 et {min(hauteur, largeur)}.")
+
+    # summed-area table, with a row and a column of zeros in front
+    table = np.zeros((nb_cartes, hauteur + 1, largeur + 1), dtype=np.float64)
+    np.cumsum(cartes, axis=1, out=table[:, 1:, 1:])
+    np.cumsum(table[:, 1:, 1:], axis=2, out=table[:, 1:, 1:])
+
+    sommes = (table[:, fenetre:, fenetre:] - table[:, :-fenetre, fenetre:]
+              - table[:, fenetre:, :-fenetre] + table[:, :-fenetre, :-fenetre])
+    resultat = sommes / (fenetre * fenetre)
+    if decimales is not None:
+        resultat = arrondir(resultat, decimales)
+
+    return resultat
+
+
+def minimums(cartes: NDArray, fenetre: int = 3,
+             decimales: int | None = None) -> tuple[NDArray, NDArray, NDArray]:
+    """Point of each map where the mean depth around it is the smallest.
+
+    :param cartes (NDArray): depths, shape (maps, rows, columns)
+    :param fenetre (int): side of the window
+    :param decimales (int | None): number of decimals of the rounded means, no rounding if None
+    :return (tuple[NDArray, NDArray, NDArray]): row, column and mean depth of
+        each map; row and column are those of the center of the window
+        (top left corner + fenetre // 2), the first one in reading order on ties
+    """
+    moyennes_cartes = moyennes(cartes, fenetre, decimales)
+    nb_cartes, _, largeur = moyennes_cartes.shape
+    positions = moyennes_cartes.reshape(nb_cartes, -1).argmin(axis=1)
+    lignes, colonnes = np.divmod(positions, largeur)
+    valeurs = moyennes_cartes[np.arange(nb_cartes), lignes, colonnes]
+
+    return lignes + fenetre // 2, colonnes + fenetre // 2, valeurs
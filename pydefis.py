@@ -5,18 +5,14 @@ from glob import glob
 import heapq
 import json
 from locale import setlocale, LC_TIME
-from math import dist, sqrt
 from operator import itemgetter
 from os import remove
 import os.path
 import string
 import re
-import unicodedata
 from zipfile import ZipFile
 
-import numpy as np
-from scipy.spatial import KDTree
-
+from mots import IndexAnagrammes, ListeMots
 
 
 def lion_nemme() -> str:
@@ -210,8 +206,7 @@ def mots_alpha() -> int:
         return mots_alpha
 
     # load list of words
-    with open(file="./mots_alpha/liste_donna.txt", mode="r", encoding="utf-8") as f:
-        liste_donna = f.readlines()
+    liste_donna = ListeMots("./mots_alpha/liste_donna.txt")
 
     mots_alpha = []
     convert = {
@@ -231,7 +226,7 @@ def mots_alpha() -> int:
     }
 
     for mot in liste_donna:
-        mots_alpha = analyse_mot(mots_alpha, mot[:-1])
+        mots_alpha = analyse_mot(mots_alpha, mot)
 
     return len(mots_alpha)
 
@@ -356,13 +351,8 @@ def insaisissable_matrice(etapes: int) -> int:
     :return (int): sum of the resulting matrix after applying
         the formula etapes times to each element
     """
-    def formule(nombre: int) -> int:
-        """Formula to be applied to nombre.
-
-        :param nombre (int): integer on which to apply formula
-        :return (int): computed value
-        """
-        return (9 * nombre + 3) % 19
+    import numpy as np
+    from recurrences import affine_scalaire
 
     source = [
         [17, 3, 4, 14, 5, 17],
@@ -372,14 +362,11 @@ def insaisissable_matrice(etapes: int) -> int:
         [6, 1, 16, 10, 5, 13],
         [11, 1, 9, 11, 18, 8]
     ]
-    matrice = [item for row in source for item in row]
-    result = matrice.copy()
-
-    for _ in range(etapes):
-        for idx in range(len(result)):
-            result[idx] = formule(result[idx])
+    # etapes applications of (9 * nombre + 3) % 19 are a single affine map A * nombre + B
+    facteur, constante = affine_scalaire(9, 3, etapes, modulo=19)
+    result = (facteur * np.array(source, dtype=np.int64) + constante) % 19
 
-    return sum(result)
+    return int(result.sum())
 
 
 def chiffres_preferes() -> None:
@@ -409,6 +396,7 @@ def professeur_guique() -> None:
         augmenter k de 1
     fin répéter
     """
+    # the stop condition depends on n, so steps are taken one at a time
     a, b, c, k, n = 1, 4, 3, 1, 0
     while k < (1000 - n):
         a = b
@@ -424,21 +412,12 @@ def professeur_guique() -> None:
 def constante_de_champernowne() -> int:
     """https://pydefis.callicode.fr/defis/Champernowne/txt
     """
-    champernowne = ""
-    idx = 1
-    while len(champernowne) < 500:
-        champernowne += str(idx)
-        idx += 1
-
-    print(champernowne)
+    from champernowne import somme
 
-    total = 0
     n1 = 424
     n2 = 493
-    for idx, c in enumerate(champernowne[n1 - 1: n2 + 1], start=n1):
-        valeur = int(c)
-        total += valeur
-        print(f'{idx:>3} {valeur} {total:>5}')
+    # positions n1 to n2 + 1, as the slice champernowne[n1 - 1: n2 + 1] of the constant
+    total = somme(n1, n2 + 1)
 
     return total
 
@@ -446,29 +425,16 @@ def constante_de_champernowne() -> int:
 def mon_beau_miroir() -> str:
     """https://pydefis.callicode.fr/defis/MiroirAjout/txt
     """
-    def palidrome(nombre: int) -> bool:
-        """Check if nombre is a palindrom.
-
-        :param nombre (int): number to check
-        :return (bool): True if nombre is a palindrome, False otherwise
-        """
-        mirror = str(nombre)[::-1]
-        return str(nombre) == mirror
+    from miroir import Miroir
 
     tableau_result = []
     entree = [396, 294, 290, 861, 481, 194, 570, 463, 265, 935]
+    miroir = Miroir()
     for x in entree:
-        i = x
-        idx = 0
-        while 1:
-            miroir = int(str(i)[::-1])
-            suivant = i + miroir
-            idx += 1
-            if palidrome(suivant):
-                tableau_result.append([suivant, idx])
-                break
-            else:
-                i = suivant
+        resultat = miroir.palindrome(x)
+        if resultat is None:
+            raise ValueError(f"{x} n'atteint pas de palindrome en {miroir.iterations_max} étapes.")
+        tableau_result.append(list(resultat))
 
     chaine = "["
     for i in tableau_result:
@@ -480,62 +446,36 @@ def mon_beau_miroir() -> str:
 def ocean_liquide_mimas() -> None:
     """https://pydefis.callicode.fr/defis/C24_Mimas/txt
     """
-    def minimums(profondeurs: list[float], prof_min: float) -> tuple[int, int]:
-        """Find minimum of ligne and colonne.
+    from profondeurs import charger_cartes, minimums
 
-        :param profondeurs (list[float]): list of depths
-        :param prof_min (float): minimum depth to search for
-        :return (tuple[int, int]): row and column indexes
-            where prof_min has been found
-        """
-        for ligne in range(1, hauteur - 1):
-            for colonne in range(1, largeur - 1):
-                total = 0
-                for y in range(-1, 2):
-                    for x in range(-1, 2):
-                        total += cartes[carte][ligne + y][colonne + x]
-                moyenne = total / 9
-                profondeurs[ligne][colonne] = round(moyenne, 1)
+    # maps separated by empty lines, the depths of a row on each line
+    FICHIER = "./ocean_liquide_mimas/cartes.txt"
+    if not os.path.exists(FICHIER):
+        # the input of the challenge is not in the repository
+        print(f"{FICHIER} absent : placer les cartes du défi dans ce fichier, séparées "
+              "par des lignes vides, une ligne de profondeurs par rangée.")
+        return
 
-                if profondeurs[ligne][colonne] < prof_min:
-                    prof_min = profondeurs[ligne][colonne]
-                    min_ligne = ligne
-                    min_colonne = colonne
+    cartes = charger_cartes(FICHIER)
+    # mean depth of the 3x3 square around each point, rounded to 1 decimal
+    lignes, colonnes, profondeurs = minimums(cartes, fenetre=3, decimales=1)
 
-        return min_ligne, min_colonne
+    for carte, (ligne, colonne, profondeur) in enumerate(zip(lignes, colonnes, profondeurs)):
+        print(f"Carte {carte} : ligne={ligne}, colonne={colonne}, profondeur={profondeur}")
 
 
 def surveillance() -> str:
     """https://pydefis.callicode.fr/defis/C24_Surveillance_1/txt
     """
-    with open("./surveillance/entree.txt", mode="r", encoding="utf-8") as f:
-        donnees = f.readlines()
-
-    # create list
-    coordonnees = []
-    for x in donnees:
-        coordonnees.append([int(x.split(", ")[0]), int(x.split(", ")[1])])
-
-    # compute distances between agents
-    surveil = []
-    for i, agent_1 in enumerate(coordonnees):
-        mini = 10**10
-        idx_mini = 0
-        for j, agent_2 in enumerate(coordonnees):
-            if i != j:
-                distance = dist(agent_1, agent_2)
-                if distance < mini:
-                    mini = distance
-                    idx_mini = j
-
-        surveil.append(idx_mini)
-
-    liste_result = []
-    for i in range(len(coordonnees)):
-        if i not in surveil:
-            liste_result.append(i)
-
-    liste_result.sort()
+    from spatial import lire_coordonnees, plus_proches_voisins
+
+    coordonnees = lire_coordonnees("./surveillance/entree.txt", dtype=int)
+
+    # nearest agent of each agent, the one with the smallest index in case of tie
+    _, surveil = plus_proches_voisins(coordonnees)
+    surveilles = set(surveil.tolist())
+
+    liste_result = [i for i in range(len(coordonnees)) if i not in surveilles]
     resultat = ""
     for x in liste_result:
         resultat += f'{x}, '
@@ -617,17 +557,11 @@ def des_lettres_bien_rangees() -> int:
     """
     with open('./des_lettres_bien_rangees/dico_accentues.json', mode="r", encoding="utf-8") as f:
         dico_accentues = json.load(f)
-    with open('./des_lettres_bien_rangees/liste_mots_donna.txt', mode="r", encoding="utf-8") as f:
-        liste_mots = f.readlines()
-    # remove trailing /n on each line
-    # and remove from list items whose lenght is less than 3
-    idx = 0
-    while idx < len(liste_mots):
-        if len(liste_mots[idx]) > 3:
-            liste_mots[idx] = liste_mots[idx][:-1]
-            idx += 1
-        else:
-            liste_mots.pop(idx)
+    # remove from list items whose lenght is less than 3
+    liste_mots = [
+        mot for mot in ListeMots('./des_lettres_bien_rangees/liste_mots_donna.txt')
+        if len(mot) >= 3
+    ]
 
     result = 0
     for mot in liste_mots:
@@ -689,8 +623,7 @@ def des_lettres_bien_rangees_2() -> int:
         :param file_path (str): path to file
         :return (list[str]): list of words
         """
-        with open(file_path, mode="r", encoding="utf-8") as f:
-            words = f.readlines()
+        words = ListeMots(file_path)
         return [word.strip() for word in words if len(word.strip()) > 3]
 
     def normalize_word(word: str, accent_map: dict[str, str]) -> str:
@@ -744,28 +677,11 @@ def persistance(nombre_1: int, nombre_2: int) -> list[int]:
     :param nombre_2 (int): upper bound of the range to analyze
     :return (list[int]): list of the count of numbers having each persistence
         value from 1 to 9, where the index of the list corresponds to the persistence value
+        minus 1 (longer if a number of the range has a larger persistence)
     """
-    result = [0] * 10
+    from persistance import histogramme
 
-    def calcul_persistance(nombre: int) -> int:
-        """Calculate the persistence of a number.
-
-        :param nombre (int): number to analyze\n
-        :return persistence (int): persistence of the number
-        """
-        while nombre > 9:
-            produit = 1
-            for chiffre in str(nombre):
-                produit *= int(chiffre)
-            nombre = produit
-
-        return produit
-
-    for i in range(nombre_1, nombre_2 + 1):
-        result[calcul_persistance(i)] += 1
-
-    # ignore first element 0
-    return result[1:]
+    return histogramme(nombre_1, nombre_2)
 
 
 def exemple_url_1() -> None:
@@ -791,35 +707,11 @@ def nombres_riches(mini: int, maxi: int) -> list[int]:
     :param mini (int): lower bound of the range to analyze
     :param maxi (int): upper bound of the range to analyze
     :return (list[int]): list of numbers in the range that
-        contain all digits from 1 to 9 in their square and cube
+        contain all digits from 0 to 9 in their square and cube
     """
-    def tous_les_chiffres(chiffres: list[int]) -> bool:
-        """Check if all digits are present in chiffres.
+    from couverture_chiffres import PANDIGITAL, scanner
 
-        :param chiffres list[int]: list of digits
-        :return (boolean): True if all digits from 1 to 9
-            are present in chiffres, False otherwise
-        """
-        for chiffre in chiffres:
-            if chiffre == 0:
-                return False
-
-        return True
-
-    result = []
-    for x in range(mini, maxi + 1):
-        chiffres = [0] * 10
-
-        carre = str(x ** 2)
-        cube = str(x ** 3)
-
-        for chiffre in carre + cube:
-            chiffres[int(chiffre)] += 1
-
-        if tous_les_chiffres(chiffres):
-            result.append(x)
-
-    return result
+    return list(scanner(mini, maxi, PANDIGITAL))
 
 
 def message_de_l_espace() -> list[int]:
@@ -892,54 +784,24 @@ def message_de_l_espace() -> list[int]:
 
 def sa_legende_est_son_anagramme() -> None:
     """https://pydefis.callicode.fr/defis/NomAnagramme2/txt"""
-    def remove_accents(input_str: str) -> str:
-        """Normalized the chain using the form NFD
-        (normalization form decomposition) which breaks down
-        the characterized characters into basic characters + accents
-
-        :param input_str (str): string to process
-        :return (str): processed string
-        """
-        normalized_str = unicodedata.normalize('NFD', input_str)
-        # remove all characters of category "Mn" (Mark, Nonspacing), which are accents,
-        # using comprehension list
-        return ''.join(
-            char for char in normalized_str
-            if unicodedata.category(char) != 'Mn'
-        )
-
     agent = "Pierre Maréchal"
-    with open(file="./sa_legende_est_son_anagramme/texte.txt", mode="r", encoding="utf-8") as f:
-        noms = f.readlines()
-
-    # get rid of accent
-    lettres_agent = remove_accents(agent)
-    # get rid of spaces and put all characters in lower case
-    lettres_agent = lettres_agent.replace(" ", "").lower()
-    # sort letters for future comparison
-    lettres_agent = sorted(lettres_agent)
-    # browse all names in the file
-    for n in noms:
-        # get rid of accent and final newline
-        nom = remove_accents(n[:-1])
-        nom = nom.replace(" ", "").lower()
-        nom = sorted(nom)
-        if nom == lettres_agent:
-            print(n)
-            break
+    # names of the file indexed by their letters, without accents nor spaces
+    noms = IndexAnagrammes("./sa_legende_est_son_anagramme/texte.txt")
+
+    for nom in noms.chercher(agent):
+        print(nom)
 
 
 def desamorcage_d_un_explosif_1() -> None:
     """https://pydefis.callicode.fr/defis/Desamorcage01/txt"""
+    from iterations import Orbite
+
     entree = "797114"
     u = entree[:3]
     n = entree[3:]
 
-    res = int(u)
-    for i in range(1, int(n) + 1):
-        res *= 13
-        res = int(str(res)[-3:])
-        print(f"{i:>3} {res}")
+    # the last 3 figures of res * 13
+    res = Orbite(lambda res: res * 13 % 1000, int(u)).etat(int(n))
 
     print(res)
 
@@ -1085,14 +947,25 @@ def sw_iv_on_passe_en_vitesse_lumiere() -> None:
     """https://pydefis.callicode.fr/defis/VitesseLumiere/txt
     Calculate navi-components.
     """
+    from iterations import Orbite
+
+    def navigation(composantes: tuple[int, int, int]) -> tuple[int, int, int]:
+        """One step of the computation of navi-components.
+
+        :param composantes (tuple[int, int, int]): x, y, z
+        :return (tuple[int, int, int]): next x, y, z
+        """
+        _, y, z = composantes
+        return (y * z) % 10000, (3 * z) % 10000, (7 * z) % 10000
+
     entree = (997, 312, 663)
-    x = entree[0]
-    y = entree[1]
-    z = entree[2]
-    while 10 * x > y:
-        x = (y * z) % 10000
-        y = (3 * z) % 10000
-        z = (7 * z) % 10000
+    orbite = Orbite(navigation, entree)
+    etapes = orbite.premier(lambda composantes: 10 * composantes[0] <= composantes[1])
+    if etapes is None:
+        print("Les composantes ne vérifient jamais 10 * x <= y.")
+        return
+
+    x, y, z = orbite.etat(etapes)
 
     print(f"Résultat = {x}, {y}, {z}")
 
@@ -1180,26 +1053,20 @@ def meli_melo_d_adresses() -> str:
 
 def le_jour_de_la_serviette() -> None:
     """https://pydefis.callicode.fr/defis/C25_4_42/txt"""
+    from serviette import triplets
+
     FICHIER = "./le_jour_de_la_serviette/resultat.txt"
+    REPRISE = "./le_jour_de_la_serviette/reprise.json"
 
     def create_result_file() -> None:
         """Create a file containing tuples of figures where
-        (a + b + c) = 444 or a * b * c = 444
+        a + b + c and a * b * c only contain figures of ref.
+        An interrupted search resumes from REPRISE.
         """
-        f = open(file=FICHIER, encoding="utf-8", mode="w")
-        print("\033[1J")
-
-        for a in range(1, 1000):
-            for b in range(1, 1000):
-                print(f"\033[1;1Ha={a} b={b}")
-                for c in range(1, 1000):
-                    somme_str = str(a + b + c)
-                    produit_str = str(a * b * c)
-                    if set(somme_str).issubset(ref) and set(produit_str).issubset(ref):
-                        f.write(f"{str((a, b, c))}\n")
-            f.flush()
-
-        f.close()
+        resultat = triplets(ref, borne=999, reprise=REPRISE)
+        with open(file=FICHIER, encoding="utf-8", mode="w") as f:
+            f.writelines(f"{str(triplet)}\n" for triplet in resultat)
+        os.remove(REPRISE)
 
     def find_max_4(list_tuples: list) -> tuple[int, int, int]:
         """Which tuple in list_tuples is the one for which
@@ -1426,34 +1293,25 @@ def photo_de_vacances() -> None:
 
 def cerbere() -> None:
     """https://pydefis.callicode.fr/defis/Herculito12Cerbere/txt"""
-    from math import sqrt, floor, ceil
+    from carres import deux_carres
 
     entree = 13979
     entree_carre = entree**2
-    for a in range(1, 13979):
-        a_c = a**2
-
-        b = sqrt(entree_carre - a_c)
-        b = ceil(b)
-        if floor(a_c + b**2) == entree_carre:
-            print(f"{a:>5} {b:>5} {floor(a_c + b**2):>12} {entree_carre:>12}")
+    for a, b in deux_carres(entree_carre):
+        if a and b:
+            print(f"{a:>5} {b:>5} {a**2 + b**2:>12} {entree_carre:>12}")
     print("Terminé.")
 
 
 def thor_le_narcissique() -> None:
     """https://pydefis.callicode.fr/defis/ThorNarcissique/txt"""
-    with open("./thor_le_narcissique/liste_mots.txt", "r", encoding="utf-8") as f:
-        mots = f.readlines()
+    from dictionnaire import Dictionnaire
 
-    mots_convenables = 0
-    for mot in mots:
-        t = mot.count("t")
-        h = mot.count("h")
-        o = mot.count("o")
-        r = mot.count("r")
+    mots = Dictionnaire(ListeMots("./thor_le_narcissique/liste_mots.txt"))
 
-        if t == 1 and h == 1 and o == 1 and r == 1:
-            mots_convenables += 1
+    convenables = ((mots.compte("t") == 1) & (mots.compte("h") == 1)
+                   & (mots.compte("o") == 1) & (mots.compte("r") == 1))
+    mots_convenables = int(convenables.sum())
 
     print(f"Résultat = {mots_convenables}")
 
@@ -1486,16 +1344,13 @@ def la_biche_de_cyrenee() -> None:
 
 def toc_boum() -> None:
     """https://pydefis.callicode.fr/defis/TocBoum/txt"""
+    from diophante import Equation
+
     nombre = 3188
-    resultats = []
-    for a in range(1, nombre):
-        for b in range(1, nombre):
-            if (13 * a + 7 * b == nombre):
-                resultats.append((a, b, abs(a - b)))
-                print(f"a={a}, b={b}")
+    # 13 * a + 7 * b = nombre, with the smallest |a - b|
+    a, b = Equation(13, 7).plus_proche(nombre)
 
-    resultats.sort(key=lambda l: l[2])
-    print(f"Résultat={resultats[0]}")
+    print(f"Résultat={(a, b, abs(a - b))}")
 
 
 def meli_melo_binaire_de_nombres() -> None:
@@ -1513,20 +1368,10 @@ def meli_melo_binaire_de_nombres() -> None:
 
 def les_chiffres_de_fibonacci() -> None:
     """https://pydefis.callicode.fr/defis/FiboChiffres/txt"""
-    entree = 61
-    fibo = [0, 1]
-    i = 1
-    while i:
-        new = sum(fibo[-2:])
-        somme = 0
-        for x in str(new):
-            somme += int(x)
+    from fibonacci import premier_avec_somme
 
-        fibo.append(new)
-        i += 1
-
-        if somme == entree:
-            break
+    entree = 61
+    _, new = premier_avec_somme(entree)
 
     print(f"Résultat = {new}")
 
@@ -1537,18 +1382,21 @@ def meli_melo_de_nombres() -> None:
     Puis, on multiplie ce résultat par 188, et on ajoute 188, ce qui donne 36472.
     Enfin, on calcule le reste de la division entière de 36472 par 9973, ce qui donne 6553.
     """
+    from iterations import Orbite
+
+    def melange(u: int) -> int:
+        """One step of the mix.
+
+        :param u (int): number of at most 4 figures
+        :return (int): next number
+        """
+        premiers, derniers = divmod(u, 100)
+        return ((premiers + derniers) * 188 + 188) % 9973
+
     u = 2963
     n = 105
 
-    while n:
-        u_str = str(u)
-        u_str = u_str.zfill(4)
-        premiers = u_str[:2]
-        derniers = u_str[-2:]
-        calcul = (int(premiers) + int(derniers)) * 188 + 188
-        u = calcul % 9973
-
-        n -= 1
+    u = Orbite(melange, u).etat(n)
 
     print(f"Résultat = {u}")
 
@@ -1560,32 +1408,10 @@ def sommes_de_trois_carres() -> None:
     Combien de nombres inférieurs ou égaux à 10000 ne peuvent pas s'écrire comme somme de 3 carrés ?
     2025-07-12 non résolu
     """
-    resultats = {}
-    for i in range(10001):
-        mini = round(sqrt(i))
-        carre = result = 0
-        trois = 3
-        liste = []
-        passage_triple = 0
-
-        while trois:
-            result = mini**2
-            if (carre + result) <= i:
-                carre += result
-                liste.append(mini)
-                trois -= 1
-            if passage_triple > 3:
-                passage_triple = 0
-                if mini >= 1:
-                    mini -= 1
-            else:
-                passage_triple += 1
+    from carres import nb_non_trois_carres
 
-        if carre == i:
-            resultats[i] = liste
-            print(f"{i:>5} {resultats[i]}")
-
-    print(f"Résultat = {len(resultats)}")
+    # Legendre: the numbers 4^a(8b + 7) are the only ones that are not sums of 3 squares
+    print(f"Résultat = {nb_non_trois_carres(10000)}")
 
 
 def l_hydre_de_lerne() -> None:
@@ -1595,50 +1421,51 @@ def l_hydre_de_lerne() -> None:
     et une tête supplémentaire repoussait encore.
     - Si à un moment l'Hydre ne possédait plus qu'une seule tête, Hercule pouvait l'achever d'un coup d'épée supplémentaire.
     """
+    from iterations import Orbite
+
+    def coup(nb_tetes: int) -> int:
+        """Heads left after a sword stroke.
+
+        :param nb_tetes (int): number of heads before the stroke
+        :return (int): number of heads after the stroke
+        """
+        nb_tetes //= 2
+        if nb_tetes != 1 and nb_tetes % 2:
+            nb_tetes = 3 * nb_tetes + 1
+
+        return nb_tetes
+
     nb_tetes = 8188
-    coups_epee = 0
-    while nb_tetes:
-        coups_epee += 1
-        nb_tetes /= 2
-        if nb_tetes == 1:
-            coups_epee += 1
-            nb_tetes = 0
-        elif nb_tetes / 2 != nb_tetes // 2:
-            nb_tetes *= 3
-            nb_tetes += 1
+    # strokes until only one head is left, plus the final one
+    coups_epee = Orbite(coup, nb_tetes).premier(lambda nb_tetes: nb_tetes == 1)
+    if coups_epee is None:
+        print(f"L'Hydre n'a jamais une seule tête, en partant de {nb_tetes} têtes.")
+        return
 
+    coups_epee += 1
     print(f"Coup d'épée nécessaires = {coups_epee}")
 
 
 def les_noms_des_ewoks() -> None:
     """https://pydefis.callicode.fr/defis/EwoksSansA/txt"""
-    with open(file="./les_noms_des_ewoks/noms_ewoks.txt", mode="r", encoding="utf-8") as f:
-        noms = f.readlines()
+    from dictionnaire import Dictionnaire
 
-    noms_sans_a = 0
-    for nom in noms:
-        if "a" not in nom and "A" not in nom:
-            noms_sans_a += 1
+    noms = Dictionnaire(ListeMots("./les_noms_des_ewoks/noms_ewoks.txt"), ignorer_casse=True)
+
+    noms_sans_a = int((noms.compte("a") == 0).sum())
 
     print(f"Résultat = {noms_sans_a}")
 
 
 def les_noms_des_ewoks_2() -> None:
     """https://pydefis.callicode.fr/defis/EwoksVoyelle/txt"""
-    with open(file="./les_noms_des_ewoks_2/noms.txt", mode="r", encoding="utf-8") as f:
-        noms = f.readlines()
+    from dictionnaire import Dictionnaire
 
-    voyelles = ["A", "E", "I", "O", "U", "Y", "a", "e", "i", "o", "u", "y"]
-    resultat = 0
-    for nom in noms:
-        nb_voyelles = 0
-        for lettre in nom:
-            if lettre in voyelles:
-                nb_voyelles += 1
+    noms = Dictionnaire(ListeMots("./les_noms_des_ewoks_2/noms.txt"), ignorer_casse=True)
 
-        nb_consonnes = len(nom) - 1 - nb_voyelles
-        if nb_consonnes == (nb_voyelles * 2):
-            resultat += 1
+    nb_voyelles = noms.compte("aeiouy")
+    nb_consonnes = noms.longueurs - nb_voyelles
+    resultat = int((nb_consonnes == nb_voyelles * 2).sum())
 
     print(f"Résultat = {resultat}")
 
@@ -1741,22 +1568,21 @@ def recherche_de_destinations() -> None:
     """https://pydefis.callicode.fr/defis/C23_RechercheDestinations/txt
     2025-07-19 : non validé
     """
+    from spatial import lire_coordonnees, plus_proches_voisins
+
     with ZipFile("./recherche_de_destinations/coordonnees_destinations_300.zip", 'r') as zip_ref:
         fichier = zip_ref.extract("coordonnees_destinations_300.txt")
 
     # 1. Lecture des données depuis un fichier
-    points = np.loadtxt(fname=fichier, delimiter=",")
-
-    # 2. Construction de l'arbre KD
-    tree = KDTree(points)
+    points = lire_coordonnees(fichier)
 
-    # 3. Trouver les 2 plus proches voisins pour chaque point (le point lui-même + le plus proche)
-    distances, indices = tree.query(points, k=2)
+    # 2. et 3. Trouver le plus proche voisin de chaque point (arbre KD)
+    distances, indices = plus_proches_voisins(points)
 
     # 4. Stocker les paires (en ignorant les doublons et soi-même)
     heap = []
 
-    for i, (d, j) in enumerate(zip(distances[:, 1], indices[:, 1])):
+    for i, (d, j) in enumerate(zip(distances, indices)):
         # éviter les doublons
         if i < j:
             heapq.heappush(heap, (d, (i, j)))
@@ -1777,20 +1603,14 @@ def l_entretien_de_stage() -> None:
     """https://pydefis.callicode.fr/defis/C26_Stage/txt
     validé
     """
-    nb_12_letters_words = 0
-    nb_words_e_3rd_position = 0
-    nb_words_l_twice = 0
-
-    with ZipFile("l_entretien_de_stage/dictionnaire.zip", "r") as zip_file:
-        with zip_file.open("dictionnaire.txt") as file:
-            for line in file:
-                word = line.decode("utf-8").strip()
-                if len(word) == 12:
-                    nb_12_letters_words += 1
-                if len(word) >= 3 and word[2] == "e":
-                    nb_words_e_3rd_position += 1
-                if word.count("l") == 2:
-                    nb_words_l_twice += 1
+    from dictionnaire import Dictionnaire
+
+    words = Dictionnaire(
+        ListeMots("l_entretien_de_stage/dictionnaire.zip", membre="dictionnaire.txt"))
+
+    nb_12_letters_words = int((words.longueurs == 12).sum())
+    nb_words_e_3rd_position = int(words.a_la_position("e", 2).sum())
+    nb_words_l_twice = int((words.compte("l") == 2).sum())
 
     print(f"Nombre de mots de 12 lettres                    : {nb_12_letters_words}")
     print(f"Nombre de mots avec 'e' à la 3ème position      : {nb_words_e_3rd_position}")
@@ -1801,68 +1621,19 @@ def un_message_des_etoiles_2() -> None:
     """https://pydefis.callicode.fr/defis/C25_SkyMap02/txt
     Presque résolu : image trouvée, mais non interprétée...
     """
-    from PIL import Image
-    from numpy.typing import NDArray
-
-    def load_images() -> list[tuple[str, Image.Image, NDArray]]:
-        """Load images.
+    from pile_images import (charger_pile, enregistrer_masque, masques_differences,
+                             variations)
 
-        :return (list[tuple[str, Image.Image, NDArray]]):
-            list of tuples containing file name, image and image as ndarray
-        """
-        all_data = []
-        files = glob("./un_message_des_etoiles_2/telescope_img*.png")
-        for i, file in enumerate(files):
-            # isolate file name
-            nom_fichier = file.split("/")[-1]
-            image = Image.open(file)
-            # convert image to numpy array
-            data = np.asarray(image)
-
-            all_data.append((nom_fichier, image, data))
-
-        return all_data
-
-    def diff_in_picture(width: int, height: int , data: NDArray, data_ref: NDArray) -> None:
-        """Find differences between image_ref and image.
-
-        :param width (int): width of the image
-        :param height (int): height of the image
-        :param data (NDArray): image as ndarray
-        :param data_ref (NDArray): image_ref as ndarray
-        """
-        for x in range(width):
-            for y in range(height):
-                if data_ref[y][x][0] != data[y][x][0]:
-                    pixels.append((x, y))
+    files = sorted(glob("./un_message_des_etoiles_2/telescope_img*.png"))
+    # first channel of every image, in a single array
+    pile = charger_pile(files, canal=0)
 
-    def build_image() -> NDArray:
-        """Build an image from differences between images and image_ref.
+    # pixels where each image differs from the most frequent value over all the images
+    for j, masque in enumerate(masques_differences(pile)):
+        enregistrer_masque(masque, f"./un_message_des_etoiles_2/results/new_image_{j:03d}.png")
 
-        :return NDArray: the new image as a ndarray
-        """
-        new_image: NDArray = np.zeros((800, 800, 3), dtype=np.uint8)
-        for x in range(800):
-            for y in range(800):
-                if (x, y) in pixels:
-                    new_image[y][x] = [255, 255, 255]
-                else:
-                    new_image[y][x] = [0, 0, 0]
-        return new_image
-
-    all_data = load_images()
-    for j in range(len(all_data)):
-        data_ref = all_data[j][2]
-        pixels = []
-        for i, (_, image, data) in enumerate(all_data):
-            if i != j:
-                if not np.array_equal(data_ref, data):
-                    diff_in_picture(image.width, image.height, data, data_ref)
-
-        new_nd = build_image()
-        new_image = Image.fromarray(new_nd)
-        new_image.save(f"./un_message_des_etoiles_2/results/new_image_{j:03d}.png") 
-        # new_image.show()
+    # pixels differing between any two images: the former comparison of every pair
+    enregistrer_masque(variations(pile), "./un_message_des_etoiles_2/results/variations.png")
 
 
 def brouillage_de_numeros_de_telephones() -> None:
@@ -1870,54 +1641,16 @@ def brouillage_de_numeros_de_telephones() -> None:
     A faire tourner en totalité pour avoir le résultat souhauté.
     20260516 : pas encore validé
     """
-    # 1. Charger le dictionnaire
-    with open("brouillage_de_numeros_de_telephones/dico.txt", encoding="utf-8") as f:
-        mots = [m.rstrip("\n").upper() for m in f if m.strip()]
-
-    cadran = {
-        2: ["A", "B", "C"],
-        3: ["D", "E", "F"],
-        4: ["G", "H", "I"],
-        5: ["J", "K", "L"],
-        6: ["M", "N", "O"],
-        7: ["P", "Q", "R", "S"],
-        8: ["T", "U", "V"],
-        9: ["W", "X", "Y", "Z"]
-    }
-
-    def creer_numero(mot: str) -> str:
-        """Créer un numéro de téléphone à partir d'un mot.
-        
-        :param mot (str): le mot à transformer
-        :return (str): le numéro de téléphone correspondant au mot
-        """
-        numero = ""
-        for lettre in mot:
-            for chiffre, lettres in cadran.items():
-                if lettre in lettres:
-                    numero += str(chiffre)
-                    break
-
-        return numero
-
-    def tableau_mots_numeros() -> dict[str, list[str]]:
-        data = {}
-        for mot in mots:
-            numero = creer_numero(mot)
-            if numero in data:
-                data[numero].append(mot)
-            else:
-                data[numero] = [mot]
+    from clavier import IndexT9
 
-        return data
+    # 1. Charger le dictionnaire et indexer chaque mot par son numéro, en une passe
+    with open("brouillage_de_numeros_de_telephones/dico.txt", encoding="utf-8") as f:
+        index = IndexT9(m.rstrip("\n").upper() for m in f if m.strip())
 
-    # obtenir un tableau de tous les mots et de leurs numéros de téléphone correspondants
-    tableau = tableau_mots_numeros()
-    # compter le nombre de mots par numéro, et trier par ordre décroissant
-    sorted_tableau = dict(sorted(tableau.items(), key=lambda item: len(item[1]), reverse=True))
-    
-    max_mots = len(next(iter(sorted_tableau.values())))
-    resultat = [num for num in sorted_tableau if len(sorted_tableau[num]) == max_mots]
+    # 2. le nombre maximal de mots pour un même numéro
+    _, mots = index.plus_ambigus(1)[0]
+    max_mots = len(mots)
+    resultat = [numero for numero, mots in index.prefixe("") if len(mots) == max_mots]
     print(resultat)
 
 
@@ -1944,48 +1677,25 @@ def mosaique_de_photos() -> None:
     """https://pydefis.callicode.fr/defis/EspionMosaic/txt
     résolu le24/05/2026 : opéra de Sydney
     """
-    from PIL import Image
+    from mosaique import assembler, lire_placements
 
-    with open(file="./mosaique_de_photos/input.txt", mode="r", encoding="utf-8") as f:
-        coordonnees = f.readlines()
-
-    result = []
-    for coord in coordonnees:
-        x, y, num_image = coord.strip().split(", ")
-        result.append((int(x), int(y), int(num_image)))
-
-    result.sort(key=lambda t: (t[0], t[1], t[2]))
-
-    # nouvelle image
-    dst = Image.new('RGB', (3424, 5728))
-    for idx, i in enumerate(result, 1):
-        im1 = Image.open(f"./mosaique_de_photos/{i[2]:03d}.jpeg")
-        dst.paste(im1, (i[0] * 32, i[1] * 32))
+    # tiles sorted by x, y and number, pasted at (x * 32, y * 32)
+    result = lire_placements("./mosaique_de_photos/input.txt")
 
-    dst.show()
+    mosaique = assembler(result, "./mosaique_de_photos/{:03d}.jpeg",
+                         "./mosaique_de_photos/mosaique.png", taille=(3424, 5728))
+    print(f"Mosaïque enregistrée dans {mosaique}")
 
 
 def sw_vii_detection_des_stormtroopers_compatissants() -> None:
     """https://pydefis.callicode.fr/defis/DetectionStormTrooper/txt
     résolu le 25/05/2026
     """
-    from itertools import combinations
+    from vampires import crocs
 
-    # list of numbers
-    nombres = list(range(1, 1001))
-    # all products of 2 different numbers in the list, with their factors,
-    # and only those with a product of 4 digits
-    produits = [(a * b, a, b) for a, b in combinations(nombres, 2) if len(str(a * b)) == 4]
-    produits = sorted(produits, key=lambda x: x[0])
-
-    result = []
-    for x in produits:
-        x_str = sorted(str(x[0]))
-        i = str(x[1])
-        j = str(x[2])
-        combined = sorted(i + j)
-        if x_str == combined:
-            result.append(x[0])
+    # products of 4 digits of 2 different numbers written with their digits,
+    # whatever the number of digits of each factor, both factors may end with 0
+    result = [produit for produit, _, _ in crocs(4, moities_egales=False, zeros_finaux=True)]
 
     resultat = ""
     for x in result:
@@ -1999,23 +1709,12 @@ def sw_vi_sur_la_lune_d_endor() -> None:
     code proposé 226720, qui est validé par la fonction,
     mais non validé par le site...
     """
+    from codes_tournants import code_suivant, verifier
+
     def check_code(code_precedent: int, code_propose: int) -> int:
-        rounds = 20
-        code = code_propose
-        for _ in range(rounds):
-            code = (code * 5231) % 999671
+        return int(verifier(code_precedent, code_propose))
 
-        if code == code_precedent:
-            return 1
-        else:
-            return 0
-    
-    code_propose = 0
-    res = 0
-    while res != 1:
-        code_propose += 1
-        res = check_code(480401, code_propose)
-        print(f"{code_propose:>6} {res}")
+    code_propose = code_suivant(480401)
 
     print(f"Solution : {code_propose}")
 
@@ -2145,4 +1844,6 @@ BWAHA BWAHA BWAA BWA BWAHA BWA BWA"""
 
 
 if __name__ == "__main__":
-    bwa()
+    from registre import main
+
+    raise SystemExit(main())
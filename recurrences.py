@@ -0,0 +1,122 @@
+"""Linear and affine recurrences, jumped to any step by matrix exponentiation.
+
+An affine update x <- A x + b on a vector of integers is the linear update of
+the augmented vector (x, 1) by the matrix
+
+    | A  b |
+    | 0  1 |
+
+so N steps are the N-th power of this matrix, computed with O(log N)
+products by exponentiation by squaring. Products use Python integers, which
+never overflow; a modulo keeps them small.
+"""
+from collections.abc import Sequence
+
+Matrice = list[list[int]]
+
+
+def identite(taille: int) -> Matrice:
+    """Identity matrix.
+
+    :param taille (int): number of rows and columns
+    :return (Matrice): identity matrix
+    """
+    return [[int(ligne == colonne) for colonne in range(taille)] for ligne in range(taille)]
+
+
+def produit(gauche: Matrice, droite: Matrice, modulo: int | None = None) -> Matrice:
+    """Product of two matrices.
+
+    :param gauche (Matrice): left matrix
+    :param droite (Matrice): right matrix
+    :param modulo (int | None): modulo applied to the coefficients, none if None
+    :return (Matrice): gauche x droite
+    """
+    colonnes = list(zip(*droite))
+    resultat = [[sum(x * y for x, y in zip(ligne, colonne)) for colonne in colonnes]
+                for ligne in gauche]
+    if modulo is not None:
+        resultat = [[x % modulo for x in ligne] for ligne in resultat]
+
+    return resultat
+
+
+def puissance(matrice: Matrice, exposant: int, modulo: int | None = None) -> Matrice:
+    """Power of a square matrix, by exponentiation by squaring.
+
+    :param matrice (Matrice): square matrix
+    :param exposant (int): power, positive or zero
+    :param modulo (int | None): modulo applied to the coefficients, none if None
+    :return (Matrice): matrice to the power exposant
+    """
+    if exposant < 0:
+        raise ValueError("l'exposant doit être positif.")
+    resultat = identite(len(matrice))
+    carre = matrice
+    while exposant:
+        if exposant & 1:
+            resultat = produit(resultat, carre, modulo)
+        exposant >>= 1
+        if exposant:
+            carre = produit(carre, carre, modulo)
+
+    return resultat
+
+
+class RecurrenceAffine:
+    """Recurrence x <- A x + b, optionally modulo m.
+
+    :param matrice (Matrice): square matrix A
+    :param constante (Sequence[int] | None): vector b, zero if None (linear recurrence)
+    :param modulo (int | None): modulo of the recurrence, none if None
+    """
+    def __init__(self, matrice: Matrice, constante: Sequence[int] | None = None,
+                 modulo: int | None = None) -> None:
+        taille = len(matrice)
+        if constante is None:
+            constante = [0] * taille
+        self.taille = taille
+        self.modulo = modulo
+        self.augmentee = [list(ligne) + [b] for ligne, b in zip(matrice, constante)]
+        self.augmentee.append([0] * taille + [1])
+
+    def saut(self, etapes: int) -> tuple[Matrice, list[int]]:
+        """Update made by several steps at once.
+
+        :param etapes (int): number of steps
+        :return (tuple[Matrice, list[int]]): matrix A_N and vector b_N such that
+            N steps turn x into A_N x + b_N
+        """
+        augmentee = puissance(self.augmentee, etapes, self.modulo)
+        return ([ligne[:self.taille] for ligne in augmentee[:self.taille]],
+                [ligne[self.taille] for ligne in augmentee[:self.taille]])
+
+    def apres(self, etat: Sequence[int], etapes: int = 1) -> list[int]:
+        """State reached after several steps.
+
+        :param etat (Sequence[int]): starting vector x
+        :param etapes (int): number of steps
+        :return (list[int]): vector after etapes steps
+        """
+        matrice, constante = self.saut(etapes)
+        resultat = [sum(a * x for a, x in zip(ligne, etat)) + b
+                    for ligne, b in zip(matrice, constante)]
+        if self.modulo is not None:
+            resultat = [x % self.modulo for x in resultat]
+
+        return resultat
+
+
+def affine_scalaire(facteur: int, constante: int, etapes: int,
+                    modulo: int | None = None) -> tuple[int, int]:
+    """Jump of the scalar recurrence x <- facteur * x + constante.
+
+    :param facteur (int): multiplier of x
+    :param constante (int): constant added
+    :param etapes (int): number of steps
+    :param modulo (int | None): modulo of the recurrence, none if None
+    :return (tuple[int, int]): A and B such that etapes steps turn x into A x + B;
+        A and B can be applied to a whole NumPy array at once
+    """
+    matrice, vecteur = RecurrenceAffine([[facteur]], [constante], modulo).saut(etapes)
+    return matrice[0][0], vecteur[0]
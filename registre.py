@@ -0,0 +1,284 @@
+"""Registry of the challenges solved in pydefis.py, with a command line runner.
+
+The registry is built by parsing pydefis.py, without importing it: listing
+the challenges costs nothing, and heavy dependencies (numpy, scipy, PIL,
+pydub, turtle) are only loaded by the solvers that need them, when they run.
+
+Usage:
+    python registre.py liste
+    python registre.py lance lapin_cretin insaisissable_matrice \\
+        --param lapin_cretin="'BWAHA...'" --param insaisissable_matrice=10
+    python registre.py lance --tous
+    python registre.py lot --tous --processus 4 --delai 60
+"""
+import argparse
+import ast
+import importlib
+import os.path
+import re
+import sys
+import traceback
+from typing import Any, NamedTuple
+
+DOSSIER = os.path.dirname(os.path.abspath(__file__))
+SOURCE = os.path.join(DOSSIER, "pydefis.py")
+
+
+class Defi(NamedTuple):
+    """A challenge solver of pydefis.py."""
+    nom: str
+    url: str | None
+    fichiers: list[str]
+    parametres: list[str]
+    modules: list[str]
+
+
+def _fichiers(fonction: ast.FunctionDef) -> list[str]:
+    """List data files referenced by a solver.
+
+    :param fonction (ast.FunctionDef): solver definition
+    :return (list[str]): relative paths found in the string literals of the solver
+    """
+    motif = re.compile(r"^(\./)?(\w+/)+[\w.*-]+$")
+    # pieces of f-strings are not complete paths
+    morceaux = {
+        id(valeur)
+        for noeud in ast.walk(fonction) if isinstance(noeud, ast.JoinedStr)
+        for valeur in noeud.values
+    }
+    fichiers = []
+    for noeud in ast.walk(fonction):
+        if id(noeud) in morceaux:
+            continue
+        if isinstance(noeud, ast.Constant) and isinstance(noeud.value, str):
+            if motif.match(noeud.value):
+                chemin = noeud.value.removeprefix("./")
+                if chemin not in fichiers:
+                    fichiers.append(chemin)
+
+    return fichiers
+
+
+def _modules(fonction: ast.FunctionDef) -> list[str]:
+    """List the modules imported by a solver when it runs.
+
+    :param fonction (ast.FunctionDef): solver definition
+    :return (list[str]): absolute names of the modules, in order of appearance
+    """
+    modules = []
+    for noeud in ast.walk(fonction):
+        if isinstance(noeud, ast.Import):
+            noms = [alias.name for alias in noeud.names]
+        elif isinstance(noeud, ast.ImportFrom) and noeud.level == 0 and noeud.module:
+            noms = [noeud.module]
+        else:
+            continue
+        modules.extend(nom for nom in noms if nom not in modules)
+
+    return modules
+
+
+def charger_defis(source: str = SOURCE) -> dict[str, Defi]:
+    """Build the registry of the solvers defined at top level of source.
+
+    :param source (str): path of the module to analyze
+    :return (dict[str, Defi]): solvers indexed by name, in source order
+    """
+    with open(source, mode="r", encoding="utf-8") as f:
+        arbre = ast.parse(f.read(), filename=source)
+
+    defis = {}
+    for noeud in arbre.body:
+        if not isinstance(noeud, ast.FunctionDef) or noeud.name.startswith("_"):
+            continue
+
+        docstring = ast.get_docstring(noeud) or ""
+        url = re.search(r"https?://\S+", docstring)
+        arguments = noeud.args.posonlyargs + noeud.args.args
+        nb_obligatoires = len(arguments) - len(noeud.args.defaults)
+        defis[noeud.name] = Defi(
+            nom=noeud.name,
+            url=url.group(0) if url else None,
+            fichiers=_fichiers(noeud),
+            parametres=[arg.arg for arg in arguments[:nb_obligatoires]],
+            modules=_modules(noeud),
+        )
+
+    return defis
+
+
+def preparer(nom: str) -> None:
+    """Import pydefis and the modules a solver imports when it runs, so that
+    they are loaded before the solver is timed.
+
+    :param nom (str): name of the solver
+    """
+    if DOSSIER not in sys.path:
+        sys.path.insert(0, DOSSIER)
+    importlib.import_module("pydefis")
+    for module in charger_defis()[nom].modules:
+        try:
+            importlib.import_module(module)
+        except ImportError:
+            # the solver itself reports the missing module when it runs
+            pass
+
+
+def lancer(nom: str, *args: Any, dossier: str = DOSSIER) -> Any:
+    """Run a solver from the data folders of the repository.
+
+    :param nom (str): name of the solver
+    :param args (Any): arguments given to the solver
+    :param dossier (str): folder containing the data folders,
+        the repository by default
+    :return (Any): value returned by the solver
+    """
+    # solvers open their data files with paths relative to the repository
+    os.chdir(dossier)
+    if DOSSIER not in sys.path:
+        sys.path.insert(0, DOSSIER)
+    import pydefis
+
+    return getattr(pydefis, nom)(*args)
+
+
+def _valeur(texte: str) -> Any:
+    """Convert a command line parameter to a Python value.
+
+    :param texte (str): parameter as typed
+    :return (Any): literal value if texte is one, otherwise texte itself
+    """
+    try:
+        return ast.literal_eval(texte)
+    except (ValueError, SyntaxError):
+        return texte
+
+
+def _parametres(params: list[str]) -> dict[str, list[Any]]:
+    """Group --param NOM=VALEUR options by solver.
+
+    :param params (list[str]): options as typed
+    :return (dict[str, list[Any]]): positional arguments of each solver
+    """
+    resultat = {}
+    for param in params:
+        nom, separateur, valeur = param.partition("=")
+        if not separateur:
+            raise SystemExit(f"Paramètre invalide (NOM=VALEUR attendu) : {param}")
+        resultat.setdefault(nom, []).append(_valeur(valeur))
+
+    return resultat
+
+
+def _selection(args: argparse.Namespace, defis: dict[str, Defi],
+               parser: argparse.ArgumentParser) -> list[tuple[str, list[Any] | None]]:
+    """Select the solvers to run from the command line.
+
+    :param args (argparse.Namespace): parsed command line
+    :param defis (dict[str, Defi]): registry of the solvers
+    :param parser (argparse.ArgumentParser): parser used to report errors
+    :return (list[tuple[str, list[Any] | None]]): names of the solvers with their
+        arguments, None for solvers ignored because parameters are missing
+    """
+    params = _parametres(args.param)
+    noms = list(defis) if args.tous else args.noms
+    if not noms:
+        parser.error("aucun défi à lancer")
+    inconnus = [nom for nom in noms if nom not in defis]
+    if inconnus:
+        parser.error(f"défi(s) inconnu(s) : {', '.join(inconnus)}")
+
+    appels = []
+    for nom in noms:
+        arguments = params.get(nom, [])
+        if len(arguments) < len(defis[nom].parametres):
+            if not args.tous:
+                parser.error(f"{nom} attend les paramètres : {', '.join(defis[nom].parametres)}")
+            arguments = None
+        appels.append((nom, arguments))
+
+    return appels
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command line entry point.
+
+    :param argv (list[str] | None): command line arguments, sys.argv[1:] if None
+    :return (int): exit status, the number of failed solvers
+    """
+    parser = argparse.ArgumentParser(description="Défis de https://pydefis.callicode.fr")
+    commandes = parser.add_subparsers(dest="commande", required=True)
+
+    commandes.add_parser("liste", help="lister les défis")
+
+    parser_lance = commandes.add_parser("lance", help="lancer un ou plusieurs défis")
+    parser_lot = commandes.add_parser(
+        "lot", help="lancer des défis en parallèle et produire un rapport de mesures")
+    for commande in (parser_lance, parser_lot):
+        commande.add_argument("noms", nargs="*", help="noms des défis à lancer")
+        commande.add_argument("--tous", action="store_true",
+                              help="lancer tous les défis (ceux qui attendent des "
+                                   "paramètres non fournis sont ignorés)")
+        commande.add_argument("--param", action="append", default=[], metavar="NOM=VALEUR",
+                              help="paramètre positionnel du défi NOM, répétable")
+    parser_lot.add_argument("--processus", type=int, default=None,
+                     help="nombre de processus simultanés (défaut : nombre de CPU)")
+    parser_lot.add_argument("--delai", type=float, default=300.0,
+                     help="durée maximale d'un défi, en secondes (défaut : 300)")
+    parser_lot.add_argument("--json", default="rapport_lot.json",
+                     help="fichier du rapport JSON (défaut : rapport_lot.json)")
+    parser_lot.add_argument("--markdown", default="rapport_lot.md",
+                     help="fichier du rapport Markdown (défaut : rapport_lot.md)")
+
+    args = parser.parse_args(argv)
+    defis = charger_defis()
+
+    if args.commande == "liste":
+        for defi in defis.values():
+            parametres = f"({', '.join(defi.parametres)})" if defi.parametres else ""
+            print(f"{defi.nom}{parametres}")
+            print(f"    {defi.url or '-'}")
+            for fichier in defi.fichiers:
+                print(f"    {fichier}")
+        return 0
+
+    appels = _selection(args, defis, parser)
+
+    if args.commande == "lot":
+        import lot
+
+        rapports = lot.executer_lot(
+            [(nom, arguments) for nom, arguments in appels if arguments is not None],
+            processus=args.processus, delai=args.delai)
+        ignores = iter({"nom": nom, "statut": lot.IGNORE} for nom, arguments in appels
+                       if arguments is None)
+        executes = iter(rapports)
+        # keep the order of the command line in the report
+        rapports = [next(executes) if arguments is not None else next(ignores)
+                    for _, arguments in appels]
+        lot.ecrire_rapports(rapports, args.json, args.markdown)
+        print(lot.rapport_markdown(rapports), end="")
+        return sum(rapport["statut"] in (lot.ERREUR, lot.DELAI_DEPASSE) for rapport in rapports)
+
+    echecs = 0
+    for nom, arguments in appels:
+        if arguments is None:
+            print(f"--- {nom} : ignoré, paramètres attendus : "
+                  f"{', '.join(defis[nom].parametres)}")
+            continue
+
+        print(f"--- {nom}")
+        try:
+            resultat = lancer(nom, *arguments)
+        except Exception:
+            traceback.print_exc()
+            echecs += 1
+        else:
+            if resultat is not None:
+                print(f"Résultat = {resultat}")
+
+    return echecs
+
+
+if __name__ == "__main__":
+    sys.exit(main())
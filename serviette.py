@@ -0,0 +1,113 @@
+"""Search of the triples (a, b, c) whose sum and product only use some digits.
+
+Instead of trying every triple (999³ ≈ 10^9 for le_jour_de_la_serviette),
+the search starts from the digit constraint: only a few numbers below 999³
+are written with the allowed digits (1022 with {2, 4}). Each of them is a
+candidate product, split into a * b * c with its divisors, and the triples
+are kept if their sum is also written with the allowed digits.
+
+The candidate products are split in blocks, searched in parallel. Each block
+found is saved in a checkpoint file, so an interrupted search resumes where
+it stopped.
+"""
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import product
+import json
+import multiprocessing
+import os
+
+NB_BLOCS = 64
+
+
+def nombres_avec_chiffres(chiffres: set[str], maximum: int) -> list[int]:
+    """Numbers written only with some digits.
+
+    :param chiffres (set[str]): allowed digits
+    :param maximum (int): largest number
+    :return (list[int]): the numbers from 1 to maximum, in increasing order
+    """
+    nombres = []
+    for longueur in range(1, len(str(maximum)) + 1):
+        for ecriture in product(sorted(chiffres), repeat=longueur):
+            nombre = int("".join(ecriture))
+            if 0 < nombre <= maximum and ecriture[0] != "0":
+                nombres.append(nombre)
+
+    return sorted(nombres)
+
+
+def _triplets_produits(produits: list[int], chiffres: set[str],
+                       borne: int) -> list[tuple[int, int, int]]:
+    """Triples whose product is one of produits and whose sum uses the allowed digits.
+
+    :param produits (list[int]): candidate products
+    :param chiffres (set[str]): allowed digits
+    :param borne (int): largest value of a, b and c
+    :return (list[tuple[int, int, int]]): triples (a, b, c) found
+    """
+    resultat = []
+    for produit in produits:
+        diviseurs = [d for d in range(1, min(borne, produit) + 1) if produit % d == 0]
+        for a in diviseurs:
+            reste = produit // a
+            for b in diviseurs:
+                if b > reste:
+                    break
+                if reste % b:
+                    continue
+                c = reste // b
+                if c <= borne and set(str(a + b + c)) <= chiffres:
+                    resultat.append((a, b, c))
+
+    return resultat
+
+
+def triplets(chiffres: set[str], borne: int = 999, processus: int | None = None,
+             reprise: str | None = None) -> list[tuple[int, int, int]]:
+    """Triples (a, b, c), 1 <= a, b, c <= borne, whose sum and product
+    are written only with some digits.
+
+    :param chiffres (set[str]): allowed digits
+    :param borne (int): largest value of a, b and c
+    :param processus (int | None): number of processes, number of CPUs if None
+    :param reprise (str | None): checkpoint file of the blocks already searched,
+        no checkpoint if None
+    :return (list[tuple[int, int, int]]): triples found, in lexicographic order
+    """
+    produits = nombres_avec_chiffres(chiffres, borne ** 3)
+    blocs = [produits[i::NB_BLOCS] for i in range(NB_BLOCS)]
+
+    faits: dict[str, list[list[int]]] = {}
+    if reprise is not None and os.path.exists(reprise):
+        with open(reprise, mode="r", encoding="utf-8") as f:
+            sauvegarde = json.load(f)
+        # a checkpoint of another search is ignored
+        if sauvegarde["chiffres"] == sorted(chiffres) and sauvegarde["borne"] == borne:
+            faits = sauvegarde["blocs"]
+
+    def sauvegarder() -> None:
+        """Save the blocks already searched to the checkpoint file."""
+        if reprise is None:
+            return
+        temporaire = f"{reprise}.tmp"
+        with open(temporaire, mode="w", encoding="utf-8") as f:
+            json.dump({"chiffres": sorted(chiffres), "borne": borne, "blocs": faits}, f)
+        os.replace(temporaire, reprise)
+
+    if multiprocessing.current_process().daemon:
+        # a daemon process cannot have children: the blocks are searched here
+        for idx, bloc in enumerate(blocs):
+            if str(idx) not in faits:
+                faits[str(idx)] = _triplets_produits(bloc, chiffres, borne)
+                sauvegarder()
+    else:
+        with ProcessPoolExecutor(max_workers=processus) as executeur:
+            futurs = {
+                executeur.submit(_triplets_produits, bloc, chiffres, borne): str(idx)
+                for idx, bloc in enumerate(blocs) if str(idx) not in faits
+            }
+            for futur in as_completed(futurs):
+                faits[futurs[futur]] = futur.result()
+                sauvegarder()
+
+    return sorted(tuple(triplet) for bloc in faits.values() for triplet in bloc)
@@ -0,0 +1,84 @@
+"""Spatial index shared by the challenges working on point coordinates.
+
+Points are stored in a KD-tree (scipy.spatial.KDTree): finding the nearest
+neighbour of every point costs O(n log n) instead of O(n²). Coordinates files
+are parsed and queried by blocks, so that the text of the lines and the
+neighbours found are only held for one block at a time; the points
+themselves are held in a single array, of the size of the whole file.
+"""
+from itertools import islice
+
+import numpy as np
+from numpy.typing import NDArray
+from scipy.spatial import KDTree
+
+TAILLE_BLOC = 100_000
+# neighbours asked to the tree for each point: the point itself may be one of
+# them, and the others are used to break ties
+VOISINS = 8
+
+
+def lire_coordonnees(fichier: str, separateur: str = ",", dtype: type = float,
+                     taille_bloc: int = TAILLE_BLOC) -> NDArray:
+    """Read a file of coordinates, one point per line, by blocks of lines.
+
+    Only the lines of one block are held at once, but all the points are
+    returned in one array.
+
+    :param fichier (str): path of the file
+    :param separateur (str): separator between coordinates
+    :param dtype (type): type of the coordinates
+    :param taille_bloc (int): number of lines parsed at once
+    :return (NDArray): array of shape (number of points, dimension)
+    """
+    blocs = []
+    with open(fichier, mode="r", encoding="utf-8") as f:
+        while lignes := [ligne for ligne in islice(f, taille_bloc) if ligne.strip()]:
+            blocs.append(np.loadtxt(lignes, delimiter=separateur, dtype=dtype, ndmin=2))
+
+    return np.concatenate(blocs)
+
+
+def plus_proches_voisins(points: NDArray,
+                         taille_bloc: int = TAILLE_BLOC) -> tuple[NDArray, NDArray]:
+    """Find the nearest other point of every point.
+
+    Ties are broken deterministically: among points at the same distance,
+    the one with the smallest index is chosen.
+
+    :param points (NDArray): array of shape (number of points, dimension)
+    :param taille_bloc (int): number of points queried at once
+    :return (tuple[NDArray, NDArray]): distance to the nearest other point and
+        index of this point, for every point
+    """
+    nb_points = len(points)
+    arbre = KDTree(points)
+    k = min(VOISINS, nb_points)
+    distances = np.empty(nb_points)
+    indices = np.empty(nb_points, dtype=np.intp)
+
+    for debut in range(0, nb_points, taille_bloc):
+        fin = min(nb_points, debut + taille_bloc)
+        d, idx = arbre.query(points[debut:fin], k=k)
+        d, idx = d.reshape(fin - debut, k), idx.reshape(fin - debut, k)
+
+        # the point itself is not its own neighbour
+        d[idx == np.arange(debut, fin)[:, None]] = np.inf
+        d_min = d.min(axis=1)
+        egaux = d == d_min[:, None]
+        distances[debut:fin] = d_min
+        indices[debut:fin] = np.where(egaux, idx, nb_points).min(axis=1)
+
+        # all the neighbours found, but the point itself, are tied: others may be tied too
+        for i in np.flatnonzero((egaux | np.isinf(d)).all(axis=1) & (k < nb_points)):
+            point = points[debut + i]
+            # widen the radius a little so that rounding keeps the tied points
+            proches = np.array(arbre.query_ball_point(point, r=d_min[i] * (1 + 1e-9) + 1e-12))
+            proches = proches[proches != debut + i]
+            # the norms may differ from the distances of the tree by an ulp: the
+            # tied points are the closest ones for the norms computed here
+            normes = np.linalg.norm(points[proches] - point, axis=1)
+            if len(normes):
+                indices[debut + i] = proches[normes == normes.min()].min()
+
+    return distances, indices
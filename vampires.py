@@ -0,0 +1,112 @@
+"""Vampire numbers: products a * b written with exactly the digits of a and b
+(1260 = 21 * 60), streamed in increasing order.
+
+Only feasible fang pairs are tried:
+- the number of digits of a and b adds up to the number of digits of the product;
+- the digits of a and b sum like those of a * b, so a + b = a * b (mod 9),
+  that is (a - 1)(b - 1) = 1 (mod 9): for each a, b lies in a single class
+  modulo 9 (none if a - 1 is a multiple of 3), and is stepped by 9;
+- optionally, a and b have the same number of digits and do not both end with 0.
+
+For each a, the candidates b are checked at once with NumPy: the digits of a
+number are counted in a single integer, 4 bits per digit. The products are
+split in intervals, searched in several processes and yielded in order.
+"""
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+
+import numpy as np
+from numpy.typing import NDArray
+
+NB_BLOCS = 64
+
+
+def _comptes(nombres: NDArray, nb_chiffres: int) -> NDArray:
+    """Count of each digit of numbers, 4 bits per digit.
+
+    :param nombres (NDArray): numbers, all with nb_chiffres digits
+    :param nb_chiffres (int): number of digits
+    :return (NDArray): bits 4d to 4d + 3 hold the number of digits d
+    """
+    comptes = np.zeros(len(nombres), dtype=np.int64)
+    reste = nombres.copy()
+    for _ in range(nb_chiffres):
+        reste, chiffre = np.divmod(reste, 10)
+        comptes += np.left_shift(1, 4 * chiffre)
+
+    return comptes
+
+
+def _crocs_intervalle(mini: int, maxi: int, nb_chiffres: int, moities_egales: bool,
+                      zeros_finaux: bool) -> list[tuple[int, int, int]]:
+    """Fang pairs whose product lies in an interval.
+
+    :param mini (int): smallest product
+    :param maxi (int): largest product, with nb_chiffres digits like mini
+    :param nb_chiffres (int): number of digits of the products
+    :param moities_egales (bool): a and b must have the same number of digits
+    :param zeros_finaux (bool): a and b may both end with 0
+    :return (list[tuple[int, int, int]]): product, a and b, with a < b,
+        sorted by product then a
+    """
+    trouves = []
+    if moities_egales:
+        longueurs = [nb_chiffres // 2] if nb_chiffres % 2 == 0 else []
+    else:
+        longueurs = range(1, nb_chiffres // 2 + 1)
+
+    for longueur_a in longueurs:
+        longueur_b = nb_chiffres - longueur_a
+        for a in range(10 ** (longueur_a - 1), 10 ** longueur_a):
+            if (a - 1) % 3 == 0:
+                continue
+            # b - 1 = inverse of a - 1, modulo 9
+            classe = (pow(a - 1, -1, 9) + 1) % 9
+            debut = max(a + 1, 10 ** (longueur_b - 1), -(-mini // a))
+            fin = min(10 ** longueur_b - 1, maxi // a)
+            debut += (classe - debut) % 9
+            if debut > fin:
+                continue
+
+            b = np.arange(debut, fin + 1, 9, dtype=np.int64)
+            if not zeros_finaux and a % 10 == 0:
+                b = b[b % 10 != 0]
+            produits = a * b
+            egaux = _comptes(produits, nb_chiffres) == (
+                _comptes(np.array([a]), longueur_a) + _comptes(b, longueur_b))
+            trouves.extend((int(p), a, int(croc)) for p, croc in zip(produits[egaux], b[egaux]))
+
+    return sorted(trouves)
+
+
+def crocs(nb_chiffres: int, moities_egales: bool = True, zeros_finaux: bool = False,
+          processus: int | None = None, nb_blocs: int = NB_BLOCS) -> Iterator[tuple[int, int, int]]:
+    """Vampire numbers with a given number of digits, and their fangs.
+
+    :param nb_chiffres (int): number of digits of the products
+    :param moities_egales (bool): a and b must have the same number of digits,
+        as in the usual definition; any split if False
+    :param zeros_finaux (bool): a and b may both end with 0, forbidden by the
+        usual definition
+    :param processus (int | None): number of processes, number of CPUs if None
+    :param nb_blocs (int): number of intervals of products searched separately
+    :return (Iterator[tuple[int, int, int]]): product, a and b, with a < b,
+        in increasing order of product; a product with several pairs of fangs
+        is yielded once for each pair
+    """
+    premier, dernier = 10 ** (nb_chiffres - 1), 10 ** nb_chiffres - 1
+    pas = -(-(dernier - premier + 1) // nb_blocs)
+    minis = list(range(premier, dernier + 1, pas))
+    maxis = [min(mini + pas - 1, dernier) for mini in minis]
+    if multiprocessing.current_process().daemon:
+        # a daemon process cannot have children: the intervals are searched here
+        for mini, maxi in zip(minis, maxis):
+            yield from _crocs_intervalle(mini, maxi, nb_chiffres, moities_egales, zeros_finaux)
+        return
+
+    with ProcessPoolExecutor(max_workers=processus) as executeur:
+        blocs = executeur.map(_crocs_intervalle, minis, maxis, [nb_chiffres] * len(minis),
+                              [moities_egales] * len(minis), [zeros_finaux] * len(minis))
+        for bloc in blocs:
+            yield from bloc